@@ -12,6 +12,8 @@
 """
 
 import pylink
+import ctypes
+import sys
 import time
 import argparse
 
@@ -38,6 +40,57 @@ def resume(jl):
         jl.restart()
         return "restart() [WARNING: resets CPU]"
 
+class FastDLL:
+    """샘플링 루프용 JLINKARM 엔트리포인트 직접 바인딩.
+
+    pylink wrapper(halt() 는 성공 시 내부에서 1초 sleep) 와 ctypes 기본 인자 추론을
+    거치지 않도록 argtypes/restype 을 고정한 별도 함수 객체를 만든다.
+    dll[name] 은 pylink 가 쓰는 dll.name 과 별개의 함수 객체라 pylink 쪽은 영향 없음.
+    시그니처는 fuzzer(JLinkHaltSampler.connect)와 동일 — ReadReg 는 U32 로 받아
+    0x80000000 이상 PC 가 음수로 오지 않게 한다.
+    """
+
+    def __init__(self, jl):
+        dll = jl._dll
+        self.go = dll['JLINKARM_Go']
+        self.go.argtypes = []
+        self.go.restype = None
+        self.halt = dll['JLINKARM_Halt']
+        self.halt.argtypes = []
+        self.halt.restype = None                # 반환값 미사용
+        self.is_halted = dll['JLINKARM_IsHalted']
+        self.is_halted.argtypes = []
+        self.is_halted.restype = ctypes.c_int8  # char — 부호 유지(<0 = DLL 오류)
+        self.read_reg = dll['JLINKARM_ReadReg']
+        self.read_reg.argtypes = [ctypes.c_uint32]
+        self.read_reg.restype = ctypes.c_uint32
+
+    def wait_halted(self, max_ms, spin=32):
+        """halted 될 때까지 대기. 확정까지 걸린 시간(ms) 반환, max_ms 초과 시 None.
+
+        대부분 halt 는 probe 왕복 1~2회 안에 끝나므로 처음 spin 회는 sleep 없이 바로
+        IsHalted 를 다시 묻는다. time.sleep(0.001) 은 Linux 에서 실제 1~2ms 가 걸려
+        그 자체가 측정을 부풀리므로, 이후에도 50us 단위로만 쉰다(monotonic deadline).
+        """
+        t0 = time.monotonic()
+        for _ in range(spin):
+            if self.is_halted() > 0:
+                return (time.monotonic() - t0) * 1000
+        deadline = t0 + max_ms / 1000
+        while time.monotonic() < deadline:
+            if self.is_halted() > 0:
+                return (time.monotonic() - t0) * 1000
+            time.sleep(0.00005)
+        return None
+
+    def sample_pc(self, pc_idx, settle_s, max_ms=50):
+        """resume → settle → halt → halted 확인 → PC 읽기 를 한 번에. (pc, halted) 반환."""
+        self.go()
+        time.sleep(settle_s)
+        self.halt()
+        halted = self.wait_halted(max_ms) is not None
+        return self.read_reg(pc_idx), halted
+
 jlink = pylink.JLink()
 jlink.open()
 
@@ -74,17 +127,26 @@ print()
 # =============================================================
 print("=== TEST 1: Register index mapping ===")
 reg_indices = jlink.register_list()
-auto_pc_index = None
-for idx in reg_indices:
-    name = jlink.register_name(idx)
-    tag = ""
-    name_up = name.upper()
-    if "R15" in name_up or name_up in ("PC", "EPC", "MEPC", "SEPC"):
+# 인덱스→이름 매핑은 코어별 고정 — DLL 조회를 한 번만 하고 TEST 1/4 에서 재사용
+REG_NAMES = tuple(jlink.register_name(idx) for idx in reg_indices)
+REG_NAMES_UP = tuple(name.upper() for name in REG_NAMES)
+PC_NAMES_EXACT = frozenset(("PC", "EPC", "MEPC", "SEPC"))
+
+
+def _is_pc_name(name_up):
+    return "R15" in name_up or name_up in PC_NAMES_EXACT
+
+
+# 사용할 PC 인덱스는 첫 매칭 하나로 결정. 태그는 PC 후보 전부에 붙인다(후보 확인용).
+auto_pc_index = next((idx for idx, name_up in zip(reg_indices, REG_NAMES_UP)
+                      if _is_pc_name(name_up)), None)
+for idx, name, name_up in zip(reg_indices, REG_NAMES, REG_NAMES_UP):
+    if _is_pc_name(name_up):
         tag = "  <-- PC (auto-detect)"
-        if auto_pc_index is None:
-            auto_pc_index = idx
-    elif "CPSR" in name_up or "PSR" in name_up:
+    elif "PSR" in name_up:   # CPSR/SPSR 포함
         tag = "  <-- status register"
+    else:
+        tag = ""
     print(f"  index {idx:3d} -> {name}{tag}")
 print()
 
@@ -106,16 +168,15 @@ print()
 # TEST 2: halt() 상태 확인
 # =============================================================
 print("=== TEST 2: halt() completion check ===")
-jlink.halt()
+fast = FastDLL(jlink)
+fast.halt()
 print(f"  halted() right after halt(): {jlink.halted()}")
 
 if not jlink.halted():
     print("  CPU not halted yet, polling...")
-    for i in range(100):
-        time.sleep(0.001)
-        if jlink.halted():
-            print(f"  halted() became True after {i+1}ms")
-            break
+    waited_ms = fast.wait_halted(100)
+    if waited_ms is not None:
+        print(f"  halted() became True after {waited_ms:.2f}ms")
     else:
         print("  WARNING: CPU still not halted after 100ms!")
 
@@ -138,9 +199,13 @@ print()
 # TEST 4: 전체 레지스터 덤프
 # =============================================================
 print("=== TEST 4: Full register dump (halted state) ===")
-for idx in reg_indices:
-    name = jlink.register_name(idx)
-    val = jlink.register_read(idx)
+# register_read_multiple = JLINKARM_ReadRegs: 전체 덤프를 USB 트랜잭션 1회로 읽는다.
+try:
+    reg_values = jlink.register_read_multiple(list(reg_indices))
+except Exception as e:
+    print(f"  (register_read_multiple 실패: {e} — 인덱스별 read 로 fallback)")
+    reg_values = [jlink.register_read(idx) for idx in reg_indices]
+for idx, name, val in zip(reg_indices, REG_NAMES, reg_values):
     print(f"  [{idx:3d}] {name:12s} = 0x{val:08X}")
 print()
 
@@ -160,36 +225,51 @@ print()
 # TEST 6: resume → halt 사이클 (PC가 변하는지 확인)
 # =============================================================
 print("=== TEST 6: resume -> sleep -> halt cycle (5 rounds) ===")
+# 고정 경로(측정값 아님): FastDLL.go 만 사용 — resume() 의 restart() fallback 은 CPU 를
+# 리셋하므로 이 테스트에서는 쓰지 않는다.
+print("  Resume: FastDLL.go (JLINKARM_Go, no restart fallback)")
+# 루프 안에서는 결과만 모으고 출력은 한 번에 — 라운드 사이 타이밍에 stdout I/O 가 끼지 않게
+rounds = []
 for i in range(5):
-    method = resume(jlink)
-    if i == 0:
-        print(f"  Resume method: {method}")
-    time.sleep(0.2)
-    jlink.halt()
-    for _ in range(50):
-        if jlink.halted():
-            break
-        time.sleep(0.001)
-    pc = jlink.register_read(PC_REG_INDEX)
-    print(f"  Round {i+1}: PC(reg[{PC_REG_INDEX}]) = 0x{pc:08X}  halted={jlink.halted()}")
+    rounds.append(fast.sample_pc(PC_REG_INDEX, 0.2))
+sys.stdout.write("".join(
+    f"  Round {i+1}: PC(reg[{PC_REG_INDEX}]) = 0x{pc:08X}  halted={halted}\n"
+    for i, (pc, halted) in enumerate(rounds)))
 print()
 
 # =============================================================
 # TEST 7: PC 주소의 명령어 읽기
 # =============================================================
 print("=== TEST 7: Instruction at reported PC ===")
+EXPECTED_ADDR = 0x5DD4
 pc_val = jlink.register_read(PC_REG_INDEX)
-try:
-    insn = jlink.memory_read32(pc_val, 1)[0]
+
+# 두 주소가 가깝고(1KB 이내) 4B 정렬이면 memory_read32 한 번(USB 1회)으로 같이 읽는다.
+words = None
+if pc_val % 4 == 0 and abs(pc_val - EXPECTED_ADDR) <= 1024:
+    base = min(pc_val, EXPECTED_ADDR)
+    try:
+        words = jlink.memory_read32(base, (max(pc_val, EXPECTED_ADDR) - base) // 4 + 1)
+    except Exception:
+        words = None   # 구간 중간이 읽기 불가일 수 있음 → 개별 read 로
+
+if words is not None:
+    insn = words[(pc_val - base) // 4]
+    insn_expected = words[(EXPECTED_ADDR - base) // 4]
     print(f"  PC = 0x{pc_val:08X}, instruction @ PC = 0x{insn:08X}")
-except Exception as e:
-    print(f"  Failed to read memory at 0x{pc_val:08X}: {e}")
+    print(f"  instruction @ 0x{EXPECTED_ADDR:X}     = 0x{insn_expected:08X}")
+else:
+    try:
+        insn = jlink.memory_read32(pc_val, 1)[0]
+        print(f"  PC = 0x{pc_val:08X}, instruction @ PC = 0x{insn:08X}")
+    except Exception as e:
+        print(f"  Failed to read memory at 0x{pc_val:08X}: {e}")
 
-try:
-    insn_expected = jlink.memory_read32(0x5DD4, 1)[0]
-    print(f"  instruction @ 0x5DD4     = 0x{insn_expected:08X}")
-except Exception as e:
-    print(f"  Failed to read memory at 0x5DD4: {e}")
+    try:
+        insn_expected = jlink.memory_read32(EXPECTED_ADDR, 1)[0]
+        print(f"  instruction @ 0x{EXPECTED_ADDR:X}     = 0x{insn_expected:08X}")
+    except Exception as e:
+        print(f"  Failed to read memory at 0x{EXPECTED_ADDR:X}: {e}")
 print()
 
 resume(jlink)
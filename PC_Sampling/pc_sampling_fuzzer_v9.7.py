@@ -98,7 +98,7 @@ import random
 import logging
 import math
 import re
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
 from typing import Set, List, Optional, Tuple, Dict, Union
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -107,7 +107,12 @@ from pathlib import Path
 # (STATE_FIELD_SETS, 아래 _CFG 로드 후 정의). state_fields.py 는 더 이상 import 하지 않음.
 from enum import Enum, IntEnum
 import contextlib
+import ctypes
 import bisect
+import heapq
+from array import array
+from itertools import accumulate, repeat
+from operator import attrgetter, itemgetter
 
 # 시드 파일 import (같은 디렉토리의 nvme_seeds.py)
 sys.path.insert(0, str(Path(__file__).parent))
@@ -647,6 +652,13 @@ class NVMeCommand:
     description: str = ""
     weight: int = 1                  # 명령어 선택 가중치 (높을수록 자주 선택)
 
+    def __post_init__(self):
+        # 매 전송마다 Enum .value 디스크립터 조회/비교를 반복하지 않도록 파생 문자열을 고정해 둔다.
+        # (cmd_type 은 생성 후 바뀌지 않는다)
+        self.type_val: str = self.cmd_type.value
+        self.passthru_type: str = ("admin-passthru" if self.cmd_type == NVMeCommandType.ADMIN
+                                   else "io-passthru")
+
 # ─────────────────────────────────────────────────────────────────
 # Rule-based Schema Mutation (v6.2)
 # ─────────────────────────────────────────────────────────────────
@@ -1078,19 +1090,39 @@ NVME_COMMANDS = NVME_COMMANDS_DEFAULT + NVME_COMMANDS_EXTENDED
 # v9.0: 이름 → NVMeCommand (LLM 이 명령 이름으로 시드/시퀀스를 제안 → Seed.cmd 구성).
 _NAME_TO_CMD: dict = {c.name: c for c in NVME_COMMANDS}
 
-# (opcode, cmd_type) → name. 동일 opcode라도 Admin/IO 구분.
-_OPCODE_TO_NAME: dict[tuple[int, str], str] = {}
 # (opcode, cmd_type) → NVMeCommand. mutation(opcode_override/force_admin)으로 실제 전송
 # opcode/타입이 바뀌면 원본 cmd 의 timeout_group 이 무효 → 실제 opcode 의 cmd 로 timeout 재해석.
 _OPCODE_TO_CMD: dict[tuple[int, str], 'NVMeCommand'] = {}
 for _c in NVME_COMMANDS:
     _key = (_c.opcode, _c.cmd_type.value)
-    if _key not in _OPCODE_TO_NAME:
-        _OPCODE_TO_NAME[_key] = _c.name
     if _key not in _OPCODE_TO_CMD:
         _OPCODE_TO_CMD[_key] = _c
 
-@dataclass
+# 타입('admin'/'io') → opcode(0~255) 인덱스 NVMeCommand 테이블. send 마다 (opcode, 타입)
+# 튜플을 만들어 해시하는 대신 정수 인덱싱으로 변이 opcode 의 timeout_group 을 재해석한다.
+# _tracking_label 의 (opcode, 타입) → 스펙 명령 이름 조회도 이 테이블을 쓴다 (동일 opcode라도 Admin/IO 구분).
+_OPCODE_CMD_TABLE: dict[str, tuple] = {
+    _t.value: tuple(_OPCODE_TO_CMD.get((_op, _t.value)) for _op in range(256))
+    for _t in NVMeCommandType
+}
+
+# nvme-cli argv 의 '--opcode=0x..' 인자 (opcode 는 8-bit) — send 마다 f-string 포맷하지 않도록 미리 생성.
+_OPCODE_ARGV: tuple = tuple(f'--opcode={_op:#x}' for _op in range(256))
+
+# mutation/페이로드 생성의 고정 포맷 — struct.pack('<H', ...) 처럼 매 호출 포맷 문자열을
+# 캐시 조회하지 않도록 컴파일된 Struct 를 재사용한다.
+_U16_LE = struct.Struct('<H')
+_U16_BE = struct.Struct('>H')
+_U32_LE = struct.Struct('<I')
+_U32_BE = struct.Struct('>I')
+_DSM_RANGE_ENTRY  = struct.Struct('<IIQ')            # Context Attrs + LBA Count + SLBA = 16B
+_COPY_RANGE_ENTRY = struct.Struct('<QHHIHH12x')      # Copy source range Format 0h = 32B
+
+# corpus 단위(Seed/SequenceSeed)는 수천 개까지 쌓이므로 인스턴스 __dict__ 없이 고정 슬롯으로.
+# dataclass(slots=True) 는 Python 3.10+ 전용 → 이전 버전에서는 기존처럼 일반 dataclass.
+_DC_SLOTS: dict = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DC_SLOTS)
 class Seed:
     """v4: 시드 데이터 구조 (Power Schedule용)"""
     data: bytes
@@ -1125,7 +1157,7 @@ class Seed:
     last_gain_exec: int = 0      # v9.2 staleness: 마지막으로 새 코드 커버리지를 낸 exec_count
     prov_id: Optional[int] = None  # v9.4 ledger: LLM 제안 계보 id(관측 전용, 결정 로직 미참조)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class SequenceSeed:
     """v7.5: N개 명령어 시퀀스를 단일 corpus 단위로 저장.
     energy = base_energy / len(commands) 패널티로 단일 Seed와 per-exec 공정 경쟁."""
@@ -1371,6 +1403,60 @@ class _LlmOnlyFilter(logging.Filter):
         return '[LLM' in record.getMessage()
 
 
+class _BufferedFileHandler(logging.FileHandler):
+    """64KB 버퍼 파일 핸들러 — 레코드마다 write() syscall 을 내지 않는다.
+
+    stock FileHandler 는 emit 마다 flush 한다. 여기서는 INFO 이하 레코드는 버퍼에 모았다가
+    _FLUSH_EVERY 건 또는 _FLUSH_INTERVAL_S 초가 지나면 flush 한다. WARNING 이상과
+    extra={'flush_now': True} 레코드(명령 전송 직전 줄 등)는 즉시 flush — timeout/crash 직전 기록 보존.
+    flush 판단은 emit() 안에서 handler lock 을 잡은 채 한다. 외부에서 부르는 h.flush()
+    (주기 fsync, 종료 경로)는 lock 을 잡고 항상 즉시 flush.
+    """
+    _BUF_SIZE         = 65536
+    _FLUSH_EVERY      = 256
+    _FLUSH_INTERVAL_S = 1.0
+
+    def __init__(self, filename, encoding=None):
+        self._pending    = 0
+        self._last_flush = time.monotonic()
+        super().__init__(filename, encoding=encoding)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self._BUF_SIZE,
+                    encoding=self.encoding, errors=getattr(self, 'errors', None))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # handle() 이 self.lock 을 잡은 상태로 호출한다. FileHandler/StreamHandler.emit 과 같은
+        # 기록 경로이되, 레코드마다 flush 하지 않고 아래 조건일 때만 flush.
+        if self.stream is None:
+            if self.mode != 'w' or not getattr(self, '_closed', False):
+                self.stream = self._open()
+        if not self.stream:
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending += 1
+        if (record.levelno >= logging.WARNING
+                or getattr(record, 'flush_now', False)
+                or self._pending >= self._FLUSH_EVERY
+                or time.monotonic() - self._last_flush >= self._FLUSH_INTERVAL_S):
+            self.flush()
+
+    def flush(self) -> None:
+        self.acquire()       # RLock — emit() 안에서 불려도 재진입 가능
+        try:
+            self._pending = 0
+            self._last_flush = time.monotonic()
+            super().flush()
+        finally:
+            self.release()
+
+
 def _setup_matplotlib_chart_env():
     """차트 생성용 matplotlib 환경 — ASCII 폰트 고정 + glyph missing 경고 억제.
 
@@ -1433,7 +1519,8 @@ def setup_logging(output_dir: str) -> Tuple[logging.Logger, str]:
     # encoding='utf-8' 명시 — sudo / C locale 환경에서 μ/✓/→/한글 깨짐 방지.
     # 주의: errors='replace' 는 Python 3.9+ 만 지원 → 호환성 위해 사용 안 함.
     # UTF-8 은 모든 Unicode 표현 가능하므로 encode 실패 가능성 없음.
-    fh = logging.FileHandler(log_file, encoding='utf-8')
+    # 64KB 버퍼 — INFO 는 모아서 flush, WARNING 이상은 즉시 (_BufferedFileHandler 참고).
+    fh = _BufferedFileHandler(log_file, encoding='utf-8')
     fh.setLevel(logging.INFO)
     fh.setFormatter(fmt)
     logger.addHandler(fh)
@@ -2076,7 +2163,7 @@ class NullSampler:
         self.current_trace:   Set[int] = set()
         self.idle_pcs:        Set[int] = set()
         self.idle_pc:         Optional[int] = None
-        self._last_raw_pcs:   List[int] = []
+        self._last_raw_pcs:   array = array('Q')
         self._last_new_pcs:   Set[int]  = set()
         self._last_new_at:    int = 0
         self._unique_at_intervals: dict = {}
@@ -2105,6 +2192,8 @@ class NullSampler:
         return None
     def _in_range(self, pc: int) -> bool:
         return False
+    def _raw_in_range(self) -> array:
+        return array('Q')
     def diagnose(self, count: int = 20) -> bool:
         log.warning("[NullSampler] diagnose 건너뜀 (idle_pcs 비어 있음)")
         return True
@@ -2114,7 +2203,7 @@ class NullSampler:
     # ── 샘플링 / 커버리지 (no-op) ─────────────────────────────
     def start_sampling(self) -> None:
         self.current_trace = set()
-        self._last_raw_pcs = []
+        self._last_raw_pcs = array('Q')
     def stop_sampling(self) -> int:
         return 0
     def _stop_worker(self) -> None:
@@ -2151,6 +2240,9 @@ class OpenOCDPCSampler:
     _SOCK_TIMEOUT    = 2.0    # 소켓 recv 타임아웃 (초)
     _RECV_BUF        = 4096
     _CONSECUTIVE_FAIL_LIMIT = 10  # 연속 read 실패 시 stop_event 세팅
+    # 페이싱 최소 sleep(ns) — 이보다 짧은 잔여시간은 sleep 하지 않는다.
+    # Linux timer slack(기본 50µs)+Python 오버헤드로 sleep 이 잔여시간보다 길게 자기 때문.
+    _PACE_MIN_SLEEP_NS = 60_000
 
     def __init__(self, config: FuzzConfig):
         self.config = config
@@ -2173,7 +2265,9 @@ class OpenOCDPCSampler:
         self.sample_thread: Optional[threading.Thread] = None
         self.total_samples    = 0
         self.interesting_inputs = 0
-        self._last_raw_pcs: List[int] = []
+        # raw PC 는 실행당 최대 max_samples_per_run 개 — 박싱된 int 리스트 대신 unboxed
+        # 64-bit 배열에 쌓는다 (원소당 8B, extend 는 튜플에서 C 레벨 복사).
+        self._last_raw_pcs: array = array('Q')
         self._out_of_range_count = 0
         self._last_new_pcs: set = set()
         self._last_new_at:  int = 0
@@ -2245,12 +2339,12 @@ class OpenOCDPCSampler:
         """포트 충돌 방지: 기존 OpenOCD 프로세스 종료 (포트+이름 양쪽)."""
         try:
             subprocess.run(['fuser', '-k', f'{self.config.openocd_port}/tcp'],
-                           capture_output=True, timeout=3.0)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3.0)
         except Exception:
             pass
         try:
             subprocess.run(['pkill', '-x', 'openocd'],
-                           capture_output=True, timeout=3.0)
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3.0)
         except Exception:
             pass
         time.sleep(1.0)   # USB 장치 해제 대기
@@ -2517,7 +2611,9 @@ class OpenOCDPCSampler:
                 log.warning(f"[OpenOCD] 무효 PC 튜플 (비-PC 값 포함): "
                             f"{' '.join(f'Core{i}={hex(pc)}' for i, pc in enumerate(pcs))}")
                 return None
-            log.debug(f"[PCSR] {' '.join(f'Core{i}={hex(pc)}' for i, pc in enumerate(pcs))}")
+            # 샘플마다 호출되는 경로 — DEBUG 가 꺼져 있으면 hex 문자열 조립 자체를 건너뛴다.
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("[PCSR] %s", ' '.join(f'Core{i}={hex(pc)}' for i, pc in enumerate(pcs)))
             return pcs
         except Exception as e:
             log.warning(f"[OpenOCD] _read_all_pcs 예외: {e}")
@@ -2614,9 +2710,9 @@ class OpenOCDPCSampler:
 
         self.idle_pcs = set(idle_universe)
 
-        from collections import Counter
+        # 최빈 PC 1개만 필요 — most_common(1) 대신 단일 패스 max (동률 시 먼저 등장한 PC, 동일)
         pc_counts = Counter(pcs_initial)
-        self.idle_pc = pc_counts.most_common(1)[0][0]
+        self.idle_pc = max(pc_counts.items(), key=itemgetter(1))[0]
 
         fail_rate = total_failures / total * 100 if total > 0 else 0
         fail_msg = (f", DAP 실패율={fail_rate:.1f}% ({total_failures}/{total}회)"
@@ -2654,6 +2750,15 @@ class OpenOCDPCSampler:
             return True
         return self.config.addr_range_start <= pc <= self.config.addr_range_end
 
+    def _raw_in_range(self) -> array:
+        """직전 윈도우 raw PC 중 펌웨어 주소 범위 내 PC (순서 유지).
+        PC 마다 _in_range 메서드 호출 + config 속성 조회를 하지 않도록 경계를 지역 변수로 1회 읽는다."""
+        lo = self.config.addr_range_start
+        hi = self.config.addr_range_end
+        if lo is None or hi is None:
+            return array('Q', self._last_raw_pcs)
+        return array('Q', [pc for pc in self._last_raw_pcs if lo <= pc <= hi])
+
     def _read_fail_needs_recovery(self) -> bool:
         """연속 read 실패가 '링크 복구가 필요한 오류'인지 여부.
 
@@ -2674,7 +2779,7 @@ class OpenOCDPCSampler:
         이유: Core 1/2가 idle이어도 Core 0이 NVMe 처리 중이면 조기 종료 안 함.
         """
         self.current_trace = set()
-        self._last_raw_pcs = []
+        self._last_raw_pcs = array('Q')
         self._out_of_range_count = 0
         self._last_new_at = 0
         self._unique_at_intervals = {}
@@ -2697,10 +2802,24 @@ class OpenOCDPCSampler:
         # GO_SETTLE: halt 샘플러에서 resume 후 다음 halt 까지 코어 최소 실행시간 보장
         # (NVMe 명령 굶김/timeout 방지). PCSR 은 go_settle_ms=0 이라 max(interval,0)=interval 무영향.
         effective_interval = max(interval, self.config.go_settle_ms / 1_000.0)
+        # 샘플 주기 페이싱(PCSR 전용): 고정 sleep 은 (읽기 시간 + sleep 지연)이 매 샘플 누적돼
+        # sub-ms interval 에서 실제 주기가 설정보다 크게 늘어진다. monotonic deadline 기준으로
+        # 남은 시간만 잔다. busy-spin 은 GIL 을 쥔 채 돌아 메인 스레드를 굶기므로 쓰지 않는다.
+        # halt 샘플러(go_settle>0)는 resume 후 최소 실행시간 보장이 목적이라 기존 고정 sleep 유지.
+        _paced       = effective_interval > 0 and self.config.go_settle_ms <= 0
+        _interval_ns = int(effective_interval * 1_000_000_000)
+        _next_ns     = time.monotonic_ns()
+        _min_sleep_ns = self._PACE_MIN_SLEEP_NS
         sat_limit        = SATURATION_LIMIT
         global_sat_limit = GLOBAL_SATURATION_LIMIT
         idle_pcs         = self.idle_pcs
         global_coverage_ref = self.global_coverage
+        # 샘플 루프 핫패스: 윈도우 동안 객체가 바뀌지 않으므로 속성 조회를 루프 밖에서 1회로
+        _trace_update = self.current_trace.update
+        _raw_extend   = self._last_raw_pcs.extend
+        _global_has_all = global_coverage_ref.issuperset
+        _checkpoints    = self._INTERVAL_CHECKPOINTS   # 클래스 속성 조회를 샘플마다 하지 않도록
+        _idle_has_all   = idle_pcs.issuperset
 
         while not self.stop_event.is_set() and sample_count < self.config.max_samples_per_run:
             pcs_tuple = self._read_all_pcs()
@@ -2741,24 +2860,25 @@ class OpenOCDPCSampler:
                           f"PC={hex(pcs_tuple[0])} 읽힘 (커버리지 측정 계속됨)")
             _consecutive_fail = 0
 
-            # 범위 분류
-            in_range_pcs = [
-                pc for pc in pcs_tuple
-                if not _has_range or (_addr_start <= pc <= _addr_end)
-            ]
+            # 범위 분류 — 범위 미지정이면 필터 자체를 건너뛰고 튜플을 그대로 쓴다
+            # (샘플마다 PC 별로 `not _has_range` 를 다시 평가하던 것을 루프 밖 분기로).
+            if _has_range:
+                in_range_pcs = [pc for pc in pcs_tuple if _addr_start <= pc <= _addr_end]
+            else:
+                in_range_pcs = pcs_tuple
             out_range_count = len(pcs_tuple) - len(in_range_pcs)
             self._out_of_range_count += out_range_count
 
             # raw log (3코어 모두)
-            self._last_raw_pcs.extend(pcs_tuple)
+            _raw_extend(pcs_tuple)
 
-            # in-range PC → current_trace 추가
-            for pc in in_range_pcs:
-                self.current_trace.add(pc)
+            # in-range PC → current_trace 추가 (set.update 1회 — PC별 add 루프 제거)
+            _trace_update(in_range_pcs)
 
             # 글로벌 포화 판정 (튜플 단위: 어느 코어든 새 PC이면 리셋)
+            # issuperset: C 레벨 멤버십 검사 1회 — any(genexpr) 대비 제너레이터 생성/프레임 비용 제거
             if in_range_pcs:
-                has_new_global = any(pc not in global_coverage_ref for pc in in_range_pcs)
+                has_new_global = not _global_has_all(in_range_pcs)
                 if has_new_global:
                     self._last_new_at = sample_count
                     since_last_global_new = 0
@@ -2767,7 +2887,7 @@ class OpenOCDPCSampler:
 
             # idle 판정 (튜플 단위: in-range PC가 모두 idle_pcs에 속해야 idle)
             if in_range_pcs and idle_pcs:
-                _tuple_all_idle = all(pc in idle_pcs for pc in in_range_pcs)
+                _tuple_all_idle = _idle_has_all(in_range_pcs)
             else:
                 _tuple_all_idle = False
 
@@ -2783,7 +2903,7 @@ class OpenOCDPCSampler:
             sample_count += 1
             self.total_samples += 1
 
-            if sample_count in self._INTERVAL_CHECKPOINTS:
+            if sample_count in _checkpoints:
                 self._unique_at_intervals[sample_count] = len(self.current_trace)
 
             # 조기 종료 조건 (OR)
@@ -2813,7 +2933,16 @@ class OpenOCDPCSampler:
                     )
                     break
 
-            if effective_interval > 0:
+            if _paced:
+                _next_ns += _interval_ns
+                _rem_ns = _next_ns - time.monotonic_ns()
+                # 0 < 잔여 < _min_sleep_ns: sleep 지연이 잔여보다 길다 → 자지 않고 바로 다음 샘플
+                if _rem_ns >= _min_sleep_ns:
+                    time.sleep(_rem_ns / 1_000_000_000)
+                elif _rem_ns <= 0:
+                    # 이미 늦었으면 밀린 주기를 몰아 따라잡지 않고 기준점을 현재로 재설정
+                    _next_ns = time.monotonic_ns()
+            elif effective_interval > 0:
                 time.sleep(effective_interval)
 
         if not self._stopped_reason:
@@ -2879,28 +3008,48 @@ class OpenOCDPCSampler:
         """
         new_pc_set = self.current_trace - self.global_coverage
         self._last_new_pcs = new_pc_set
-        self.global_coverage.update(self.current_trace)
+        # 합집합 결과는 동일 — 이미 아는 PC 까지 다시 해시하지 않도록 차집합만 합친다.
+        self.global_coverage |= new_pc_set
         new_pcs = len(new_pc_set)
 
         is_interesting = new_pcs > 0
         return is_interesting, new_pcs
 
     def load_coverage(self, filepath: str) -> int:
-        """이전 세션의 커버리지 파일을 로드하여 global_coverage에 합산"""
+        """이전 세션의 커버리지 파일을 로드하여 global_coverage에 합산
+
+        .bin 이면 little-endian uint32 raw 덤프(coverage.bin), 그 외는 hex 텍스트(coverage.txt)."""
         loaded_pcs = 0
         if not os.path.exists(filepath):
             log.warning(f"[Coverage] File not found: {filepath}")
             return 0
+        if filepath.endswith('.bin'):
+            # 줄 단위 int(line, 16) 파싱 없이 한 번에 읽어 set 에 C 레벨로 합산
+            pcs = array('I')
+            with open(filepath, 'rb') as f:
+                pcs.frombytes(f.read(os.path.getsize(filepath) // pcs.itemsize * pcs.itemsize))
+            if sys.byteorder != 'little':
+                pcs.byteswap()
+            self.global_coverage.update(pcs)
+            loaded_pcs = len(pcs)
+            log.info(f"[Coverage] Loaded {loaded_pcs} PCs from {filepath} "
+                     f"(global: {len(self.global_coverage)} PCs)")
+            return loaded_pcs
         with open(filepath, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+            lines = [ln for ln in f.read().split('\n') if ln and not ln.isspace()]
+        try:
+            # 정상 파일: map(int, .., 16) 으로 한 번에 변환 후 set 에 일괄 합산 (int() 는 앞뒤 공백 허용)
+            pcs = list(map(int, lines, repeat(16)))
+        except ValueError:
+            # 깨진 줄이 섞인 파일: 줄 단위로 파싱 가능한 것만 (기존 동작)
+            pcs = []
+            for line in lines:
                 try:
-                    self.global_coverage.add(int(line, 16))
-                    loaded_pcs += 1
+                    pcs.append(int(line, 16))
                 except ValueError:
                     pass
+        self.global_coverage.update(pcs)
+        loaded_pcs = len(pcs)
 
         log.info(f"[Coverage] Loaded {loaded_pcs} PCs from {filepath} "
                  f"(global: {len(self.global_coverage)} PCs)")
@@ -2909,12 +3058,27 @@ class OpenOCDPCSampler:
     def save_coverage(self, output_dir: str):
         """현재 global_coverage를 파일로 저장"""
         pc_path = os.path.join(output_dir, 'coverage.txt')
+        sorted_pcs = sorted(self.global_coverage)
+        # map(hex) + join 으로 문자열을 C 레벨에서 한 번에 만들고 write 1회 (줄 단위 f-string 생성 제거)
         with open(pc_path, 'w') as f:
-            for pc in sorted(self.global_coverage):
-                f.write(f"{hex(pc)}\n")
+            if sorted_pcs:
+                f.write('\n'.join(map(hex, sorted_pcs)) + '\n')
 
         log.info(f"[Coverage] Saved {len(self.global_coverage)} PCs → {_logname(pc_path)}")
 
+        # --resume-coverage 용 바이너리 덤프(PC 당 4B, 텍스트 파싱 없이 로드). coverage.txt 는
+        # 후처리 스크립트 호환을 위해 그대로 유지한다.
+        bin_path = os.path.join(output_dir, 'coverage.bin')
+        try:
+            pcs = array('I', sorted_pcs)
+        except OverflowError:
+            log.warning("[Coverage] 32-bit 범위 밖 PC 존재 — coverage.bin 생략 (coverage.txt 사용)")
+            return
+        if sys.byteorder != 'little':
+            pcs.byteswap()
+        with open(bin_path, 'wb') as f:
+            pcs.tofile(f)
+
     def close(self):
         self.stop_event.set()
         if self.sample_thread:
@@ -3006,6 +3170,8 @@ class JLinkHaltSampler(OpenOCDPCSampler):
         self._halt_func = None
         self._read_reg_func = None
         self._go_func = None
+        self._is_halted_func = None
+        self._pc_reg_arg = None
         # 단일코어 표기(halt 는 PC 1개) + invalid mask 를 P9 DPIDR 기준으로 정리
         self._pcsr_addrs = [0x80030000]
         self._invalid_pc_mask = frozenset(set(config.invalid_pc_vals) | {0x80030000})
@@ -3074,9 +3240,27 @@ class JLinkHaltSampler(OpenOCDPCSampler):
             except Exception:
                 _pcname = '?'
             # DLL 함수 캐싱 (wrapper 오버헤드 회피 — tight halt 루프 가속)
-            self._halt_func = jl._dll.JLINKARM_Halt
-            self._read_reg_func = jl._dll.JLINKARM_ReadReg
-            self._go_func = jl._dll.JLINKARM_Go
+            # _dll[name] 은 pylink 가 쓰는 _dll.name 과 별개의 함수 객체를 새로 만든다 →
+            # argtypes/restype 을 명시해도 pylink 내부 호출에는 영향 없음. 시그니처를 고정하면
+            # 매 호출 인자 타입 추론이 빠지고, ReadReg(U32) 가 기본 c_int 로 부호 해석돼
+            # 0x80000000 이상 PC 가 음수로 오던 것도 바로잡힌다.
+            # jlink_reg_diag.py 의 FastDLL 도 같은 방식·같은 시그니처로 바인딩한다(함께 유지).
+            _dll = jl._dll
+            self._halt_func = _dll['JLINKARM_Halt']
+            self._halt_func.argtypes = []
+            self._halt_func.restype = None          # 반환값 미사용
+            self._read_reg_func = _dll['JLINKARM_ReadReg']
+            self._read_reg_func.argtypes = [ctypes.c_uint32]
+            self._read_reg_func.restype = ctypes.c_uint32
+            self._pc_reg_arg = ctypes.c_uint32(self._pc_reg_index)   # 매 샘플 int→c_uint32 변환 생략
+            self._go_func = _dll['JLINKARM_Go']
+            self._go_func.argtypes = []
+            self._go_func.restype = None
+            # halted() 폴링도 동일 — pylink.halted() 는 IsHalted 결과 <0 이면 예외, >0 이면 True
+            # (DLL 반환형은 char → c_int8 로 받아 부호 유지)
+            self._is_halted_func = _dll['JLINKARM_IsHalted']
+            self._is_halted_func.argtypes = []
+            self._is_halted_func.restype = ctypes.c_int8
             log.warning(f"[J-Link] 연결 성공: {self.config.jlink_device} @ "
                         f"{self.config.jlink_speed}kHz ({self.config.interface.upper()}), "
                         f"PC reg index={self._pc_reg_index} (name={_pcname})")
@@ -3118,19 +3302,22 @@ class JLinkHaltSampler(OpenOCDPCSampler):
             halted = False
             try:
                 self._halt_func()
+                _is_halted = self._is_halted_func
                 for _ in range(self.config.halt_poll_ms):   # 최대 ~halt_poll_ms ms 대기(1ms 간격)
-                    try:
-                        if self.jlink.halted():
-                            halted = True
-                            break
-                    except Exception:
+                    _r = _is_halted()
+                    if _r > 0:
+                        halted = True
+                        break
+                    if _r < 0:                  # DLL 오류 — pylink.halted() 의 예외 경로와 동일하게 중단
                         break
                     time.sleep(0.001)
                 if halted:
                     # 프리즈 측정: halted 확정 시점 → Go 반환 까지 코어가 정지한 시간.
                     # (halt 요청~halted 확정 사이는 코어가 아직 실행 중이라 제외 → 보수적.)
                     _fz0 = time.monotonic()
-                    pc = self._read_reg_func(self._pc_reg_index)
+                    # 32-bit 로 고정: restype 이 signed 로 돌아가도 0x80000000 이상 PC 가
+                    # 음수로 들어와 array('Q') 에서 OverflowError 가 나지 않게.
+                    pc = self._read_reg_func(self._pc_reg_arg) & 0xFFFFFFFF
                     self._go_func()   # halt 성공 시에만 resume
                     self.halt_freeze_accum += time.monotonic() - _fz0
                 # halt 실패(코어가 clock-gated/WFI 로 안 멈춤)면 Go 하지 않는다: 코어는
@@ -3473,9 +3660,12 @@ class NVMeFuzzer:
     """다중 Opcode 지원 NVMe 퍼저 (v4.3: subprocess nvme-cli + 글로벌 포화 설정 분리)"""
 
     VERSION = FUZZER_VERSION
+    # 주기 status 시 로그 파일 flush+fsync 최소 간격 — 100 exec 마다가 아니라 시간 기준
+    _LOG_SYNC_INTERVAL_NS = 5_000_000_000
 
     def __init__(self, config: FuzzConfig):
         self.config = config
+        self._last_log_sync_ns: int = 0       # 마지막 로그 flush+fsync 시각(monotonic_ns)
         self._vmon_prev_used = None           # v8.6: vmon exec-기반 샘플 상태(스레드 없음)
         self._vmon_last_taint = None
         # halt 샘플러 health 모니터 상태 — (A)무해 WFI vs (B)코어 고착 판별용
@@ -3521,8 +3711,13 @@ class NVMeFuzzer:
             self.sampler = OpenOCDPCSampler(config)
 
         if config.enabled_commands:
-            # --commands 지정 시: NVME_COMMANDS 전체에서 이름 매칭
-            base = [c for c in NVME_COMMANDS if c.name in config.enabled_commands]
+            # --commands 지정 시: NVME_COMMANDS 전체에서 이름 매칭 (순서는 NVME_COMMANDS 정의 순 유지).
+            # 이름 집합 1회 구성 → 명령마다 리스트 선형 탐색하지 않음. 오타 이름은 조용히 버리지 않고 경고.
+            _wanted = set(config.enabled_commands)
+            base = [c for c in NVME_COMMANDS if c.name in _wanted]
+            _unknown = [n for n in config.enabled_commands if n not in _NAME_TO_CMD]
+            if _unknown:
+                log.warning(f"[Fuzzer] --commands 에 알 수 없는 명령 이름 무시: {_unknown}")
         elif config.all_commands:
             # --all-commands: 위험 명령어 포함 전체
             base = NVME_COMMANDS.copy()
@@ -3534,6 +3729,11 @@ class NVMeFuzzer:
         # 초기 Format/Sanitize one-shot(아래 게이트가 self.commands 멤버십을 봄)까지 자동 스킵.
         # (seed 생성/opcode 변이는 이미 excluded 를 존중. 이로써 --exclude-opcodes 가 전 경로 차단.)
         _excl = set(config.excluded_opcodes)
+        # opcode 변이 경로용 256-bit 비트맵(int) — 변이마다 set(excluded_opcodes) 를 재구성하지 않는다.
+        self._excluded_opcode_bits: int = 0
+        for _op in _excl:
+            if 0 <= _op <= 0xFF:
+                self._excluded_opcode_bits |= 1 << _op
         if _excl:
             _filtered = [c for c in base if c.opcode not in _excl]
             if _filtered:
@@ -3566,6 +3766,7 @@ class NVMeFuzzer:
 
         self.executions = 0
         self.start_time: Optional[datetime] = None
+        self._start_ns: int = 0                                # start_time 과 같은 시점의 monotonic_ns
         self._current_ps: int = 0                              # 현재 PS 상태
         self._prev_op_ps: int = 0                             # 마지막 operational PS (0~2) — PS3/4 timeout 기준
         self.ps_exec_counts: dict[int, int] = {i: 0 for i in range(5)}  # PS별 실행 횟수
@@ -3617,7 +3818,8 @@ class NVMeFuzzer:
         self.cmd_stats: dict[str, dict] = defaultdict(_cs_new)
         for c in self.commands:
             self.cmd_stats[c.name] = _cs_new()
-        self.rc_stats: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        # 명령별 rc 카운터 — 내부는 Counter(누락 키 0, pickle 가능), 팩토리는 lambda 없이 클래스 직접
+        self.rc_stats: dict[str, Counter] = defaultdict(Counter)
         # v9.1: SC=0x01(Invalid Opcode) 지배로 "이 펌웨어 미구현" 확정된 명령 집합(런타임 갱신).
         self._unimpl_cmds: set = set()
         self._last_nvme_status: Optional[int] = None  # 직전 send 의 NVMe full status(0=성공, None=errno/내부)
@@ -3635,9 +3837,10 @@ class NVMeFuzzer:
         #   첫 갱신 전까지 v9.5 와 동작 동일). _boost_sel/_boost_gain 은 **구간** 카운터로,
         #   각각 origin(llm|mutation)별 **선택 횟수**(분모)와 새 edge 수(분자)를 센다.
         self._llm_boost: float = RAG_ENERGY_BOOST
-        self._boost_exec: dict = {}    # origin 별 **명령 실행 수**(분모 — 소비한 장치 시간)
-        self._boost_sel: dict = {}     # origin 별 선택 횟수(진단 표시용, 분모 아님)
-        self._boost_gain: dict = {}    # origin 별 새 edge 수(분자)
+        # 실행/선택마다 증가하는 카운터 — defaultdict(int) 로 d[k] += 1 (get+set 2회 조회 제거)
+        self._boost_exec: dict = defaultdict(int)  # origin 별 **명령 실행 수**(분모 — 소비한 장치 시간)
+        self._boost_sel: dict = defaultdict(int)   # origin 별 선택 횟수(진단 표시용, 분모 아님)
+        self._boost_gain: dict = defaultdict(int)  # origin 별 새 edge 수(분자)
         self._llm_boost_hist: list = []
         # v9.4: 3축 성장 스냅샷 이력(별도 그래프 파일 coverage_growth_plot.py 가 읽음).
         self._cov_growth_hist: list = []
@@ -3694,7 +3897,8 @@ class NVMeFuzzer:
         # sequence 실행 중 개별 저장 대신 누적 — 완료 시 SequenceSeed로 저장
         self._seq_sink: Optional[dict] = None  # {'commands', 'new_pcs', 'covered_pcs', 'interesting'}
         # 실제 전송된 opcode 분포 (원본과 다른 경우만)
-        self.actual_opcode_dist: dict[int, int] = defaultdict(int)
+        # v9.7: opcode(0~255) 인덱스 고정 카운터 — dict 해시 없이 list 인덱싱으로 증가
+        self.actual_opcode_dist: list[int] = [0] * 256
         # 실제 전송된 passthru 타입 분포
         self.passthru_stats = {"admin-passthru": 0, "io-passthru": 0}
 
@@ -3713,6 +3917,7 @@ class NVMeFuzzer:
         self._current_mutations: List[int] = []                     # 현재 실행에서 사용된 operator 목록
         self.mopt_mode: str = 'pilot'  # 'pilot' 또는 'core'
         self.mopt_weights: List[float] = [1.0 / self.NUM_MUTATION_OPS] * self.NUM_MUTATION_OPS
+        self._mopt_cum_weights: List[float] = list(accumulate(self.mopt_weights))  # core 선택용 누적합
         self.mopt_pilot_rounds: int = 0
 
         self._det_queue: deque = deque()  # (seed, generator) pairs
@@ -3726,6 +3931,11 @@ class NVMeFuzzer:
             self.cmd_traces[c.name] = deque(maxlen=200)
 
         self._nvme_input_path: Optional[str] = None
+        self._nvme_input_fd: Optional[int] = None   # 입력 파일 persistent fd (pwrite 재사용)
+        self._nvme_input_pass_fds: tuple = ()       # memfd 일 때 nvme-cli 에 물려줄 fd
+        self._nvme_input_size: int = 0              # 입력 파일 현재 크기 (ftruncate 생략 판정)
+        self._nvme_argv_cache: dict = {}   # _nvme_argv_parts 메모
+        self._timeout_ms_by_group: Optional[dict] = None   # _nvme_timeout_ms_table 메모
 
         self._cmd_history: deque = deque(maxlen=100)
 
@@ -3785,10 +3995,10 @@ class NVMeFuzzer:
             if seed.force_admin is not None:
                 actual_type = "admin" if seed.force_admin else "io"
             else:
-                actual_type = cmd.cmd_type.value
-            spec_name = _OPCODE_TO_NAME.get((seed.opcode_override, actual_type))
-            if spec_name is not None:
-                return spec_name
+                actual_type = cmd.type_val
+            spec_cmd = _OPCODE_CMD_TABLE[actual_type][seed.opcode_override]
+            if spec_cmd is not None:
+                return spec_cmd.name
             return f"unknown_{actual_type}_op0x{seed.opcode_override:02X}"
         return cmd.name
 
@@ -3842,7 +4052,7 @@ class NVMeFuzzer:
         #   '첫' 직접 coverage/timeout 이 여기서 측정되지만 ledger 커버리지 밖 — 소급분석 시
         #   executions 총합과 ledger record 수의 차이는 이 calibration 실행 때문이다(v9.5 에서
         #   calibration 요약 record 추가 고려).
-        pc_appearances: Dict[int, int] = {}          # PC → 등장 횟수
+        pc_appearances: Counter = Counter()          # PC → 등장 횟수
         actual_runs = 0
         self._cal_last_rc = 0  # 호출자에게 마지막 rc 전달용
 
@@ -3856,8 +4066,7 @@ class NVMeFuzzer:
             actual_runs += 1
             self._cal_last_rc = rc
 
-            for pc in self.sampler.current_trace:
-                pc_appearances[pc] = pc_appearances.get(pc, 0) + 1
+            pc_appearances.update(self.sampler.current_trace)   # C 레벨 일괄 카운트
 
             if rc == self.RC_TIMEOUT:
                 log.error(f"[Calibration] {seed.cmd.name} timeout at run {run_i+1} — treating as crash")
@@ -3870,9 +4079,9 @@ class NVMeFuzzer:
                 break
 
         # PC 안정성 계산 (과반수 기준)
-        all_seen_pcs = set(pc_appearances.keys())
-        stable_threshold = actual_runs / 2.0
-        stable_pcs = {pc for pc, cnt in pc_appearances.items() if cnt > stable_threshold}
+        # 과반수: cnt > actual_runs/2 ⇔ cnt*2 > actual_runs (정수 비교, float 나눗셈 없음)
+        all_seen_pcs = set(pc_appearances)
+        stable_pcs = {pc for pc, cnt in pc_appearances.items() if cnt * 2 > actual_runs}
         stability = len(stable_pcs) / max(len(all_seen_pcs), 1)
 
         seed.is_calibrated = True
@@ -3898,8 +4107,7 @@ class NVMeFuzzer:
             self._ledger_write({
                 'run_id': self._run_id_get(),
                 'exec': self.executions,
-                'elapsed_s': (round((datetime.now() - self.start_time).total_seconds(), 1)
-                              if self.start_time else 0),
+                'elapsed_s': round(self._elapsed_s(), 1),
                 'cmd': seed.cmd.name,
                 'src': self._cov_src_tag(seed, 'c1'),
                 'seed_class': getattr(seed, 'seed_class', None),
@@ -3920,11 +4128,65 @@ class NVMeFuzzer:
 
         return seed
 
+    _DET_PLAN: Optional[tuple] = None   # _det_plan() 메모 (클래스 공유 — 입력값과 무관한 상수)
+
+    @classmethod
+    def _det_plan(cls) -> tuple:
+        """deterministic stage 의 값-독립 변이 계획 (최초 1회 생성).
+        (bitflip XOR 마스크, ±delta 산술 순서, interesting 32-bit 값, (바이트 유지마스크, 대입값들)×4)
+        — 필드·시드마다 1<<bit, range(), & 0xFF 시프트를 다시 계산하지 않는다."""
+        plan = cls._DET_PLAN
+        if plan is None:
+            arith = []
+            for delta in range(1, DETERMINISTIC_ARITH_MAX + 1):
+                arith += (delta, -delta)          # 기존 순서(+d, −d) 유지
+            plan = (
+                tuple(1 << bit for bit in range(32)),
+                tuple(arith),
+                tuple(val & 0xFFFFFFFF for val in cls.INTERESTING_32),
+                tuple((~(0xFF << shift), tuple((val & 0xFF) << shift for val in cls.INTERESTING_8))
+                      for shift in (0, 8, 16, 24)),
+            )
+            cls._DET_PLAN = plan
+        return plan
+
+    _DET_VALUES_CACHE: dict = {}   # original → _det_values() 결과 (클래스 공유, 상한 _DET_VALUES_MAX)
+    _DET_VALUES_MAX = 64
+
+    @classmethod
+    def _det_values(cls, original: int) -> tuple:
+        """필드 원본값 하나에 대한 deterministic 대입값 전체를 평탄 배열로 (word, byte).
+        word = Phase 1~3 (bitflip → ±arith → interesting 32) 순서, byte = Phase 4 (원본과 같은 값 제외).
+        값이 원본에만 의존하므로 한 번 만든 배열은 같은 원본값을 가진 다른 시드/필드가 재사용한다
+        (0, 기본 LBA 등 흔한 값). 32-bit 범위 밖 원본은 array('I') 에 못 담으므로 캐시 없이 tuple."""
+        cached = cls._DET_VALUES_CACHE.get(original)
+        if cached is not None:
+            return cached
+        flip_masks, arith_deltas, interesting_32, byte_plan = cls._det_plan()
+        word = [original ^ mask for mask in flip_masks]
+        word += [(original + delta) & 0xFFFFFFFF for delta in arith_deltas]
+        word += interesting_32
+        byte = [new_val for keep_mask, byte_vals in byte_plan
+                for new_val in ((original & keep_mask) | bv for bv in byte_vals)
+                if new_val != original]
+        if not 0 <= original <= 0xFFFFFFFF:
+            return tuple(word), tuple(v & 0xFFFFFFFF for v in byte)
+        if len(cls._DET_VALUES_CACHE) >= cls._DET_VALUES_MAX:
+            cls._DET_VALUES_CACHE.clear()
+        cached = cls._DET_VALUES_CACHE[original] = (array('I', word), array('I', byte))
+        return cached
+
     def _deterministic_stage(self, seed: Seed):
         """CDW 필드에 대한 체계적 경계값 탐색 (제너레이터).
-        대상: cdw10~cdw15 중 값이 0이 아닌 필드."""
+        대상: cdw10~cdw15 중 값이 0이 아닌 필드.
+
+        변이마다 Seed 를 새로 복제하지 않고, 복제본(work) 하나의 CDW 필드만 덮어써 yield 한다.
+        소비 측(메인 루프 → _send_nvme_command/_account_command)은 yield 받은 시드를 그 iteration
+        안에서만 읽고, corpus/시퀀스에 넣을 때는 필드를 복사한 새 Seed 를 만든다 → 공유해도 안전.
+        호출자는 yield 받은 work 를 수정하거나 다음 next() 이후까지 보관하면 안 된다.
+        대입값 목록은 _det_values() 가 원본값별 평탄 배열로 미리 만든다."""
         cdw_fields = ['cdw10', 'cdw11', 'cdw12', 'cdw13', 'cdw14', 'cdw15']
-        arith_max = DETERMINISTIC_ARITH_MAX
+        work = self._clone_seed(seed)
 
         for field_name in cdw_fields:
             original = getattr(seed, field_name)
@@ -3933,39 +4195,20 @@ class NVMeFuzzer:
             if original == 0 and field_name in ('cdw13', 'cdw14', 'cdw15'):
                 continue
 
-            # Phase 1: Walking bitflip (32개)
-            for bit in range(32):
-                new_seed = self._clone_seed(seed)
-                setattr(new_seed, field_name, original ^ (1 << bit))
-                yield new_seed
-
-            # Phase 2: Arithmetic +/- 1~arith_max
-            for delta in range(1, arith_max + 1):
-                new_seed = self._clone_seed(seed)
-                setattr(new_seed, field_name, (original + delta) & 0xFFFFFFFF)
-                yield new_seed
-
-                new_seed = self._clone_seed(seed)
-                setattr(new_seed, field_name, (original - delta) & 0xFFFFFFFF)
-                yield new_seed
-
-            # Phase 3: Interesting 32-bit values
-            for val in self.INTERESTING_32:
-                new_seed = self._clone_seed(seed)
-                setattr(new_seed, field_name, val & 0xFFFFFFFF)
-                yield new_seed
-
-        # Phase 4: 각 CDW의 바이트 위치에 interesting 8-bit 값 대입
+            # Phase 1~3: Walking bitflip(32) → Arithmetic ±1~arith_max → Interesting 32-bit
+            for new_val in self._det_values(original)[0]:
+                setattr(work, field_name, new_val)
+                yield work
+
+            setattr(work, field_name, original)   # 다음 필드 변이 시 이 필드는 원본 값
+
+        # Phase 4: 각 CDW의 바이트 위치에 interesting 8-bit 값 대입 (동일 값은 _det_values 에서 제외)
         for field_name in cdw_fields:
             original = getattr(seed, field_name)
-            for shift in (0, 8, 16, 24):
-                for val in self.INTERESTING_8:
-                    mask = 0xFF << shift
-                    new_val = (original & ~mask) | ((val & 0xFF) << shift)
-                    if new_val != original:  # 동일 값이면 건너뛰기
-                        new_seed = self._clone_seed(seed)
-                        setattr(new_seed, field_name, new_val & 0xFFFFFFFF)
-                        yield new_seed
+            for new_val in self._det_values(original)[1]:
+                setattr(work, field_name, new_val)
+                yield work
+            setattr(work, field_name, original)
 
     def _mopt_select_operator(self) -> int:
         """MOpt: 현재 모드에 따른 mutation operator 선택."""
@@ -3973,14 +4216,10 @@ class NVMeFuzzer:
             # Pilot: 균등 분포
             return random.randint(0, self.NUM_MUTATION_OPS - 1)
         else:
-            # Core: 가중치 기반 선택
-            r = random.random()
-            cumulative = 0.0
-            for i, w in enumerate(self.mopt_weights):
-                cumulative += w
-                if r <= cumulative:
-                    return i
-            return self.NUM_MUTATION_OPS - 1
+            # Core: 가중치 기반 선택 — 누적합은 가중치 갱신 시 1회 계산, 여기선 이진 탐색만.
+            # bisect_left = 'r <= cumulative 인 첫 i' (기존 선형 누적 루프와 동일 결과)
+            i = bisect.bisect_left(self._mopt_cum_weights, random.random())
+            return i if i < self.NUM_MUTATION_OPS else self.NUM_MUTATION_OPS - 1
 
     def _mopt_update_phase(self):
         """MOpt: pilot/core 모드 전환 및 가중치 갱신."""
@@ -4009,6 +4248,7 @@ class NVMeFuzzer:
                     self.mopt_weights[i] = max(self.mopt_weights[i], min_w)
                 total = sum(self.mopt_weights)
                 self.mopt_weights = [w / total for w in self.mopt_weights]
+                self._mopt_cum_weights = list(accumulate(self.mopt_weights))
 
                 self.mopt_mode = 'core'
                 self.mopt_pilot_rounds = 0
@@ -5516,8 +5756,7 @@ class NVMeFuzzer:
             self._proposal_write({
                 'run_id': self._run_id_get(), 'prov_id': seed.prov_id,
                 'task': res.get('task'), 'kind': 'seed', 'exec': self.executions,
-                'elapsed_s': (round((datetime.now() - self.start_time).total_seconds(), 1)
-                              if self.start_time else 0),
+                'elapsed_s': round(self._elapsed_s(), 1),
                 'seed_class': seed.seed_class, 'command': seed.cmd.name,
                 'cdw10': seed.cdw10, 'cdw11': seed.cdw11,
                 'data_len': (len(seed.data) if getattr(seed, 'data', None) is not None else None),
@@ -5564,8 +5803,7 @@ class NVMeFuzzer:
             self._proposal_write({
                 'run_id': self._run_id_get(), 'prov_id': _seq_pid,
                 'task': res.get('task'), 'kind': 'seq', 'exec': self.executions,
-                'elapsed_s': (round((datetime.now() - self.start_time).total_seconds(), 1)
-                              if self.start_time else 0),
+                'elapsed_s': round(self._elapsed_s(), 1),
                 'seed_class': 'llm_seq', 'members': [s.cmd.name for s in seeds],
             })
             if RAG_DEBUG:
@@ -5589,8 +5827,7 @@ class NVMeFuzzer:
             self._proposal_write({
                 'run_id': self._run_id_get(), 'prov_id': _wl['prov_id'],
                 'task': res.get('task'), 'kind': 'workload', 'exec': self.executions,
-                'elapsed_s': (round((datetime.now() - self.start_time).total_seconds(), 1)
-                              if self.start_time else 0),
+                'elapsed_s': round(self._elapsed_s(), 1),
                 'seed_class': 'llm_io', 'pattern': _wl.get('pattern'),
                 'lba_span': _wl.get('lba_span'), 'block_size': _wl.get('block_size'),
                 'hot_fraction': _wl.get('hot_fraction'), 'read_ratio': _wl.get('read_ratio'),
@@ -5683,7 +5920,13 @@ class NVMeFuzzer:
         if axis == 'edge':
             _o, _, _f = src.partition('/')
             if _f in ('cmd', 'seq'):
-                self._boost_gain[_o] = self._boost_gain.get(_o, 0) + n
+                self._boost_gain[_o] += n
+
+    def _elapsed_s(self) -> float:
+        """메인 루프 시작 후 경과 초 (monotonic). 시작 전이면 0."""
+        if not self.start_time:
+            return 0
+        return (time.monotonic_ns() - self._start_ns) / 1_000_000_000
 
     # ── v9.4 ledger (관측 전용 — 어떤 결정 로직도 이 값을 읽지 않는다) ──────────────
     def _run_id_get(self) -> str:
@@ -5848,22 +6091,21 @@ class NVMeFuzzer:
               CDW/data 변이가 핸들러에 닿지 못해 커버리지 기여 구조적 0(Entropic/AFLFast COE 근거)."""
         n = len(seed.commands) if isinstance(seed, SequenceSeed) else 1
 
-        if (RAG_UNIMPL_FLOOR_ON and isinstance(seed, Seed)
+        # _unimpl_cmds 가 비어 있으면(대부분의 구간) 라벨 계산 자체를 건너뜀
+        if (RAG_UNIMPL_FLOOR_ON and self._unimpl_cmds and isinstance(seed, Seed)
                 and self._tracking_label(seed.cmd, seed) in self._unimpl_cmds):
             return RAG_ENERGY_FLOOR / n   # boost 미적용(죽은 opcode는 되살리지 않음)
 
         if seed.exec_count == 0:
             return self._llm_energy_adjust(seed, MAX_ENERGY / n)
 
-        ratio = self.executions / seed.exec_count
-        if ratio <= 1:
+        if self.executions <= seed.exec_count:
             return self._apply_staleness(seed, self._llm_energy_adjust(seed, 1.0 / n))
 
-        try:
-            power = int(math.log2(ratio))
-            factor = min(MAX_ENERGY, 2 ** power)
-        except (ValueError, OverflowError):
-            factor = 1.0
+        # v9.7: floor(log2(executions / exec_count)) 를 정수 연산으로 — 매 선택마다 corpus 전체에
+        #       도는 경로라 float 나눗셈 + math.log2 를 뺀다. 2^k <= a/b ⇔ 2^k <= a//b 이므로 결과 동일.
+        power = (self.executions // seed.exec_count).bit_length() - 1
+        factor = min(MAX_ENERGY, 1 << power)
 
         return self._apply_staleness(seed, self._llm_energy_adjust(seed, factor / n))
 
@@ -5889,7 +6131,7 @@ class NVMeFuzzer:
         """
         try:
             _o = 'llm' if self._is_llm_seed(seed) else 'mutation'
-            self._boost_sel[_o] = self._boost_sel.get(_o, 0) + 1
+            self._boost_sel[_o] += 1
         except Exception:
             pass
 
@@ -5900,11 +6142,15 @@ class NVMeFuzzer:
             return None
 
         # 에너지 계산
+        _calc = self._calculate_energy
         for seed in self.corpus:
-            seed.energy = self._calculate_energy(seed)
+            seed.energy = _calc(seed)
 
         # 가중치 랜덤 선택
-        total_energy = sum(s.energy for s in self.corpus)
+        # v9.7: 누적합을 C 레벨(accumulate)로 한 번 만들고 bisect로 탐색 —
+        #       Python 루프 누적 대비 선택 비용 감소 (분포는 동일)
+        cum = list(accumulate(s.energy for s in self.corpus))
+        total_energy = cum[-1]
         if total_energy <= 0:
             seed = random.choice(self.corpus)
             seed.exec_count += 1
@@ -5912,21 +6158,13 @@ class NVMeFuzzer:
             self._boost_count_selection(seed)
             return seed
 
-        r = random.uniform(0, total_energy)
-        cumulative = 0
-        for seed in self.corpus:
-            cumulative += seed.energy
-            if r <= cumulative:
-                seed.exec_count += 1
-                self._last_selected = seed
-                self._boost_count_selection(seed)
-                return seed
-
-        # fallback
-        self.corpus[-1].exec_count += 1
-        self._last_selected = self.corpus[-1]
-        self._boost_count_selection(self.corpus[-1])
-        return self.corpus[-1]
+        idx = bisect.bisect_left(cum, random.uniform(0, total_energy))
+        # fallback: 부동소수 오차로 r > cum[-1]인 경우 마지막 시드
+        seed = self.corpus[min(idx, len(cum) - 1)]
+        seed.exec_count += 1
+        self._last_selected = seed
+        self._boost_count_selection(seed)
+        return seed
 
     def _epoch_reset_corpus(self):
         """v6.1: Epoch 경계에서 corpus를 favored+초기 시드만 유지하고 energy 감쇠.
@@ -6242,7 +6480,7 @@ class NVMeFuzzer:
         try:
             _bo, _, _bf = self._cov_src_tag(seed, source, seq_member=seq_member).partition('/')
             if _bf in ('cmd', 'seq'):
-                self._boost_exec[_bo] = self._boost_exec.get(_bo, 0) + 1
+                self._boost_exec[_bo] += 1
         except Exception:
             pass
 
@@ -6369,8 +6607,8 @@ class NVMeFuzzer:
 
         self.cmd_pcs[track_key].update(self.sampler.current_trace)
         if self.sampler._last_raw_pcs:
-            raw_in_range = [pc for pc in self.sampler._last_raw_pcs
-                            if self.sampler._in_range(pc)]
+            # cmd_traces 에 명령당 최대 200개 보관되는 trace — 박싱 int 리스트 대신 unboxed 배열로
+            raw_in_range = self.sampler._raw_in_range()
             if raw_in_range:
                 self.cmd_traces[track_key].append(raw_in_range)
 
@@ -6387,10 +6625,12 @@ class NVMeFuzzer:
                  f"last_new_at={self.sampler._last_new_at}{mopt_tag} "
                  f"stop={self.sampler._stopped_reason}")
 
-        if self.sampler._unique_at_intervals:
-            log.debug(f"  saturation: {self.sampler._unique_at_intervals}")
-        if self.sampler._last_raw_pcs:
-            log.debug(f"  ALL raw PCs: {[hex(pc) for pc in self.sampler._last_raw_pcs]}")
+        # raw PC 덤프는 샘플 수만큼 hex 리스트를 만든다 — DEBUG 핸들러가 없으면 조립하지 않는다.
+        if log.isEnabledFor(logging.DEBUG):
+            if self.sampler._unique_at_intervals:
+                log.debug("  saturation: %s", self.sampler._unique_at_intervals)
+            if self.sampler._last_raw_pcs:
+                log.debug("  ALL raw PCs: %s", [hex(pc) for pc in self.sampler._last_raw_pcs])
 
         # v9.4 ledger(관측 전용, 궤적 불변): 주목할만한 실행만 기록 — interesting / SC-depth 전진 /
         #   신규 SC / LLM 귀속. mutation-origin no-op 대량 기록을 피해 파일 크기를 억제한다.
@@ -6411,8 +6651,7 @@ class NVMeFuzzer:
             self._ledger_write({
                 'run_id': self._run_id_get(),
                 'exec': self.executions,
-                'elapsed_s': (round((datetime.now() - self.start_time).total_seconds(), 1)
-                              if self.start_time else 0),
+                'elapsed_s': round(self._elapsed_s(), 1),
                 'cmd': track_key,
                 'src': self._cov_src_tag(seed, source, seq_member=seq_member),
                 'seed_class': getattr(seed, 'seed_class', None),
@@ -6562,7 +6801,8 @@ class NVMeFuzzer:
             if self.config.state_enabled and source == 'c1':
                 self._csfuzz_c1_rewards.append(1)
 
-            input_hash = hashlib.md5(fuzz_data).hexdigest()[:12]
+            # 파일명 dedup 용 비암호 지문 — blake2b 6B digest(=12 hex, 기존 md5[:12] 와 같은 길이).
+            input_hash = hashlib.blake2b(fuzz_data, digest_size=6).hexdigest()
             corpus_file = self.output_dir / 'corpus' / f"input_{cmd.name}_{hex(cmd.opcode)}_{input_hash}"
             corpus_file.parent.mkdir(parents=True, exist_ok=True)
             with open(corpus_file, 'wb') as f:
@@ -6596,15 +6836,15 @@ class NVMeFuzzer:
         # 100회 주기
         if self.executions % 100 == 0:
             self._seq_cmds_in_window = 0   # Phase 3: sequence 명령 window 초기화
-            _now = datetime.now()
-            _wdt = (_now - self._window_t0).total_seconds()
+            _now_ns = time.monotonic_ns()
+            _wdt = (_now_ns - self._window_t0) / 1_000_000_000
             _wexec = self.executions - self._window_exec0
             _window_eps = _wexec / _wdt if _wdt > 0 else 0
-            self._window_t0 = datetime.now()
+            self._window_t0 = _now_ns
             self._window_exec0 = self.executions
 
-            _elapsed_snap = (datetime.now() - self.start_time).total_seconds() \
-                            if self.start_time else 0
+            _elapsed_snap = ((_now_ns - self._start_ns) / 1_000_000_000
+                             if self.start_time else 0)
             _bbpct = _fpct = None
             if self._sa_loaded:
                 _bbpct = (100.0 * len(self._sa_covered_bbs) / self._sa_total_bbs
@@ -6641,10 +6881,14 @@ class NVMeFuzzer:
 
             stats = self._collect_stats()
             self._print_status(stats, last_samples, window_eps=_window_eps)
-            for h in log.handlers:
-                h.flush()
-                if isinstance(h, logging.FileHandler) and h.stream:
-                    os.fsync(h.stream.fileno())
+            # fsync 는 디스크 왕복이라 고속 구간(수백 exec/s)에서 100 exec 마다 부르면 초당 여러 번.
+            # 호스트 행/리부트 대비 보존 목적엔 수 초 단위면 충분 — timeout/crash 경로는 별도로 즉시 flush.
+            if _now_ns - self._last_log_sync_ns >= self._LOG_SYNC_INTERVAL_NS:
+                self._last_log_sync_ns = _now_ns
+                for h in log.handlers:
+                    h.flush()
+                    if isinstance(h, logging.FileHandler) and h.stream:
+                        os.fsync(h.stream.fileno())
 
         if self.executions % 10000 == 0 and self.executions > 0:
             self._log_device_info()   # 주기적 Device Information(id-ctrl/id-ns) 재출력
@@ -6783,38 +7027,45 @@ class NVMeFuzzer:
         if len(self.corpus) <= 10:
             return
 
-        # Pass 1: 단일 Seed만으로 PC → best 매핑 (data 크기 기준)
-        pc_best: dict[int, object] = {}
+        # PC → best 매핑을 PC 단위 dict 갱신 대신 '작은 시드부터 아직 임자 없는 PC 를 가져가는'
+        # 단일 패스로 계산한다. 각 PC 의 첫 임자 = data 가 가장 작은 시드(동률이면 corpus 앞쪽 —
+        # 안정 정렬) 이므로 기존 pc_best 와 favored 결과가 같다. 시드당 C 레벨 차집합 1회.
+        claimed: Set[int] = set()
         for seed in self.corpus:
-            if not isinstance(seed, Seed) or not seed.covered_pcs:
-                continue
-            for pc in seed.covered_pcs:
-                cur = pc_best.get(pc)
-                if cur is None or len(seed.data) < len(cur.data):
-                    pc_best[pc] = seed
-
-        # Pass 2: 단일 Seed가 없는 PC만 SequenceSeed가 채움
+            seed.is_favored = False
+
+        # Pass 1: 단일 Seed만, data 크기 오름차순 (corpus 순서 자체는 바꾸지 않음)
+        _singles = sorted((s for s in self.corpus if isinstance(s, Seed) and s.covered_pcs),
+                          key=lambda s: len(s.data))
+        for seed in _singles:
+            gained = seed.covered_pcs - claimed
+            if gained:
+                seed.is_favored = True
+                claimed |= gained
+
+        # Pass 2: 단일 Seed가 없는 PC만 SequenceSeed가 채움 (corpus 순서)
         for seed in self.corpus:
             if not isinstance(seed, SequenceSeed) or not seed.covered_pcs:
                 continue
-            for pc in seed.covered_pcs:
-                if pc not in pc_best:
-                    pc_best[pc] = seed
-
-        # favored 마킹
-        favored_seeds = {id(s) for s in pc_best.values()}
-        for seed in self.corpus:
-            seed.is_favored = id(seed) in favored_seeds
+            gained = seed.covered_pcs - claimed
+            if gained:
+                seed.is_favored = True
+                claimed |= gained
 
         # 제거 대상: favored 아님 + exec_count >= 2 + 기본 시드 아님 (found_at > 0)
         # SequenceSeed도 단일 Seed와 동일한 선택 압력 적용.
         before = len(self.corpus)
         # v9.0 ②: LLM 시드는 exec_count < RAG_CULL_GRACE 동안 컬링 보호(변이 탐색 기회 부여) —
         #   부스트로 자주 뽑혀 exec_count 가 빨리 2에 닿아도 바로 안 잘리게.
-        _to_remove = [s for s in self.corpus
-                      if not (s.is_favored or s.exec_count < 2 or s.found_at == 0
-                              or self._llm_cull_protected(s))]
-        _removed_seq_set = {id(s) for s in _to_remove if isinstance(s, SequenceSeed)}
+        #   보존/제거를 한 번의 순회로 분할 (보존 조건을 시드마다 두 번 평가하지 않음).
+        _kept: list = []
+        _to_remove: list = []
+        _protected = self._llm_cull_protected
+        for s in self.corpus:
+            if s.is_favored or s.exec_count < 2 or s.found_at == 0 or _protected(s):
+                _kept.append(s)
+            else:
+                _to_remove.append(s)
         if RAG_DEBUG:   # ① 가시성: 어느 LLM 시드가 왜 잘리는지
             for s in _to_remove:
                 if self._is_llm_seed(s):
@@ -6822,9 +7073,7 @@ class NVMeFuzzer:
                     log.warning(f"[LLM/cull] {_nm} exec_count={s.exec_count} "
                                 f"covered_pcs={len(s.covered_pcs) if s.covered_pcs else 0} "
                                 f"favored={s.is_favored}")
-        self.corpus = [s for s in self.corpus
-                       if s.is_favored or s.exec_count < 2 or s.found_at == 0
-                       or self._llm_cull_protected(s)]
+        self.corpus = _kept
         removed = before - len(self.corpus)
         if removed > 0:
             log.info(f"[Cull] corpus {before} → {len(self.corpus)} "
@@ -6839,15 +7088,17 @@ class NVMeFuzzer:
         hard_limit = self.config.max_corpus_hard_limit
         if hard_limit > 0 and len(self.corpus) > hard_limit:
             before_hard = len(self.corpus)
-            protected = [s for s in self.corpus if s.found_at == 0 or s.is_favored]
-            evictable = sorted(
-                [s for s in self.corpus if s.found_at > 0 and not s.is_favored],
-                key=lambda s: s.exec_count, reverse=True
-            )
+            protected: list = []
+            evictable: list = []
+            for s in self.corpus:
+                (protected if s.found_at == 0 or s.is_favored else evictable).append(s)
             keep = max(0, hard_limit - len(protected))
-            kept_ids = {id(s) for s in protected + evictable[:keep]}
-            _evicted = [s for s in self.corpus if id(s) not in kept_ids]
-            self.corpus = protected + evictable[:keep]
+            # 상위 keep 개만 필요 → 전체 정렬 대신 nlargest (O(N log k)).
+            # nlargest 는 sorted(..., reverse=True)[:keep] 과 동일 결과(동률 시 corpus 순서 유지).
+            _kept_evictable = heapq.nlargest(keep, evictable, key=attrgetter('exec_count'))
+            kept_ids = {id(s) for s in _kept_evictable}
+            _evicted = [s for s in evictable if id(s) not in kept_ids]
+            self.corpus = protected + _kept_evictable
             log.info(f"[Cull] Hard limit {hard_limit}: corpus {before_hard} → {len(self.corpus)}")
             for s in _evicted:
                 if isinstance(s, SequenceSeed):
@@ -6881,6 +7132,11 @@ class NVMeFuzzer:
     INTERESTING_16 = [-32768, -129, 128, 255, 256, 512, 1000, 1024, 4096, 32767]
     INTERESTING_32 = [-2147483648, -100663046, -32769, 32768, 65535, 65536,
                       100663045, 2147483647]
+    # 변이용 풀: 폭별로 미리 연결·마스킹 — 변이마다 리스트 연결 + '& mask' 없이 choice 만
+    _INT_8_POOL  = tuple(v & 0xFF for v in INTERESTING_8)
+    _INT_16_POOL = tuple(v & 0xFFFF for v in INTERESTING_8 + INTERESTING_16)
+    _INT_32_POOL = tuple(v & 0xFFFFFFFF
+                         for v in INTERESTING_8 + INTERESTING_16 + INTERESTING_32)
 
     ARITH_MAX = 35  # AFL++ default
 
@@ -6889,170 +7145,180 @@ class NVMeFuzzer:
         if not data:
             return data
 
+        # 최대 128회 스택 루프 — 속성/모듈 조회를 지역 변수로 1회 바인딩.
+        # randrange(n) 은 randint(0, n-1) 과 같은 난수열을 만들되 호출 단계가 하나 적다.
+        _randint = random.randint
+        _randrange = random.randrange
+        _random = random.random
+        _choice = random.choice
+        _getrandbits = random.getrandbits
+        _select_op = self._mopt_select_operator
+        _record_mut = self._current_mutations.append
+        max_len = self.config.max_input_len
+
         buf = bytearray(data)
         # AFL++ havoc: 2^(1~7) 스택 횟수
-        stack_power = random.randint(1, 7)
+        stack_power = _randint(1, 7)
         num_mutations = 1 << stack_power
 
         for _ in range(num_mutations):
             if not buf:
                 buf = bytearray(b'\x00')
-            mut = self._mopt_select_operator()
-            self._current_mutations.append(mut)
+            mut = _select_op()
+            _record_mut(mut)
 
             if mut == 0:
                 # --- bitflip 1/1 ---
-                pos = random.randint(0, len(buf) - 1)
-                buf[pos] ^= (1 << random.randint(0, 7))
+                pos = _randrange(len(buf))
+                buf[pos] ^= (1 << _randrange(8))
 
             elif mut == 1:
                 # --- interesting 8-bit ---
-                pos = random.randint(0, len(buf) - 1)
-                buf[pos] = random.choice(self.INTERESTING_8) & 0xFF
+                pos = _randrange(len(buf))
+                buf[pos] = _choice(self._INT_8_POOL)
 
             elif mut == 2 and len(buf) >= 2:
                 # --- interesting 16-bit (LE) ---
-                pos = random.randint(0, len(buf) - 2)
-                val = random.choice(self.INTERESTING_8 + self.INTERESTING_16) & 0xFFFF
-                if random.random() < 0.5:
+                pos = _randrange(len(buf) - 1)
+                val = _choice(self._INT_16_POOL)
+                if _random() < 0.5:
                     # little-endian
-                    struct.pack_into('<H', buf, pos, val)
+                    _U16_LE.pack_into(buf, pos, val)
                 else:
                     # big-endian
-                    struct.pack_into('>H', buf, pos, val)
+                    _U16_BE.pack_into(buf, pos, val)
 
             elif mut == 3 and len(buf) >= 4:
                 # --- interesting 32-bit (LE/BE) ---
-                pos = random.randint(0, len(buf) - 4)
-                val = random.choice(
-                    self.INTERESTING_8 + self.INTERESTING_16 + self.INTERESTING_32
-                ) & 0xFFFFFFFF
-                if random.random() < 0.5:
-                    struct.pack_into('<I', buf, pos, val)
+                pos = _randrange(len(buf) - 3)
+                val = _choice(self._INT_32_POOL)
+                if _random() < 0.5:
+                    _U32_LE.pack_into(buf, pos, val)
                 else:
-                    struct.pack_into('>I', buf, pos, val)
+                    _U32_BE.pack_into(buf, pos, val)
 
             elif mut == 4:
                 # --- arith 8-bit (add/sub) ---
-                pos = random.randint(0, len(buf) - 1)
-                delta = random.randint(1, self.ARITH_MAX)
-                if random.random() < 0.5:
+                pos = _randrange(len(buf))
+                delta = _randint(1, self.ARITH_MAX)
+                if _random() < 0.5:
                     buf[pos] = (buf[pos] + delta) & 0xFF
                 else:
                     buf[pos] = (buf[pos] - delta) & 0xFF
 
             elif mut == 5 and len(buf) >= 2:
                 # --- arith 16-bit (add/sub, LE/BE) ---
-                pos = random.randint(0, len(buf) - 2)
-                delta = random.randint(1, self.ARITH_MAX)
-                if random.random() < 0.5:
-                    val = struct.unpack_from('<H', buf, pos)[0]
-                    val = (val + random.choice([-delta, delta])) & 0xFFFF
-                    struct.pack_into('<H', buf, pos, val)
+                pos = _randrange(len(buf) - 1)
+                delta = _randint(1, self.ARITH_MAX)
+                if _random() < 0.5:
+                    val = _U16_LE.unpack_from(buf, pos)[0]
+                    val = (val + _choice([-delta, delta])) & 0xFFFF
+                    _U16_LE.pack_into(buf, pos, val)
                 else:
-                    val = struct.unpack_from('>H', buf, pos)[0]
-                    val = (val + random.choice([-delta, delta])) & 0xFFFF
-                    struct.pack_into('>H', buf, pos, val)
+                    val = _U16_BE.unpack_from(buf, pos)[0]
+                    val = (val + _choice([-delta, delta])) & 0xFFFF
+                    _U16_BE.pack_into(buf, pos, val)
 
             elif mut == 6 and len(buf) >= 4:
                 # --- arith 32-bit (add/sub, LE/BE) ---
-                pos = random.randint(0, len(buf) - 4)
-                delta = random.randint(1, self.ARITH_MAX)
-                if random.random() < 0.5:
-                    val = struct.unpack_from('<I', buf, pos)[0]
-                    val = (val + random.choice([-delta, delta])) & 0xFFFFFFFF
-                    struct.pack_into('<I', buf, pos, val)
+                pos = _randrange(len(buf) - 3)
+                delta = _randint(1, self.ARITH_MAX)
+                if _random() < 0.5:
+                    val = _U32_LE.unpack_from(buf, pos)[0]
+                    val = (val + _choice([-delta, delta])) & 0xFFFFFFFF
+                    _U32_LE.pack_into(buf, pos, val)
                 else:
-                    val = struct.unpack_from('>I', buf, pos)[0]
-                    val = (val + random.choice([-delta, delta])) & 0xFFFFFFFF
-                    struct.pack_into('>I', buf, pos, val)
+                    val = _U32_BE.unpack_from(buf, pos)[0]
+                    val = (val + _choice([-delta, delta])) & 0xFFFFFFFF
+                    _U32_BE.pack_into(buf, pos, val)
 
             elif mut == 7:
                 # --- random byte set ---
-                pos = random.randint(0, len(buf) - 1)
-                buf[pos] = random.randint(0, 255)
+                pos = _randrange(len(buf))
+                buf[pos] = _randint(0, 255)
 
             elif mut == 8 and len(buf) >= 2:
                 # --- byte swap (2 bytes) ---
-                pos1 = random.randint(0, len(buf) - 1)
-                pos2 = random.randint(0, len(buf) - 1)
+                pos1 = _randrange(len(buf))
+                pos2 = _randrange(len(buf))
                 buf[pos1], buf[pos2] = buf[pos2], buf[pos1]
 
             elif mut == 9:
                 # --- delete bytes (1~len/4) ---
                 if len(buf) > 1:
-                    del_len = random.randint(1, max(1, len(buf) // 4))
-                    del_pos = random.randint(0, len(buf) - del_len)
+                    del_len = _randint(1, max(1, len(buf) // 4))
+                    del_pos = _randrange(len(buf) - del_len + 1)
                     del buf[del_pos:del_pos + del_len]
 
             elif mut == 10:
                 # --- insert bytes (clone or random) ---
-                ins_len = random.randint(1, min(128, max(1, len(buf) // 4)))
-                ins_pos = random.randint(0, len(buf))
-                if random.random() < 0.5 and len(buf) >= ins_len:
+                ins_len = _randint(1, min(128, max(1, len(buf) // 4)))
+                ins_pos = _randrange(len(buf) + 1)
+                if _random() < 0.5 and len(buf) >= ins_len:
                     # clone existing chunk
-                    src = random.randint(0, len(buf) - ins_len)
+                    src = _randrange(len(buf) - ins_len + 1)
                     chunk = bytes(buf[src:src + ins_len])
                 else:
-                    # random bytes
-                    chunk = bytes(random.randint(0, 255) for _ in range(ins_len))
+                    # random bytes (getrandbits 1회 — 바이트별 randint 제너레이터 대신).
+                    # random.randbytes 는 3.9+ 전용이라 쓰지 않음(같은 시드 난수열 유지).
+                    chunk = _getrandbits(8 * ins_len).to_bytes(ins_len, 'little')
                 buf[ins_pos:ins_pos] = chunk
 
             elif mut == 11 and len(buf) >= 2:
                 # --- overwrite bytes (clone or random) ---
-                ow_len = random.randint(1, min(128, max(1, len(buf) // 4)))
-                ow_pos = random.randint(0, max(0, len(buf) - ow_len))
-                if random.random() < 0.5 and len(buf) >= ow_len:
-                    src = random.randint(0, len(buf) - ow_len)
+                ow_len = _randint(1, min(128, max(1, len(buf) // 4)))
+                ow_pos = _randint(0, max(0, len(buf) - ow_len))
+                if _random() < 0.5 and len(buf) >= ow_len:
+                    src = _randrange(len(buf) - ow_len + 1)
                     buf[ow_pos:ow_pos + ow_len] = buf[src:src + ow_len]
                 else:
-                    for i in range(min(ow_len, len(buf) - ow_pos)):
-                        buf[ow_pos + i] = random.randint(0, 255)
+                    _n = min(ow_len, len(buf) - ow_pos)
+                    buf[ow_pos:ow_pos + _n] = _getrandbits(8 * _n).to_bytes(_n, 'little')
 
             elif mut == 12 and len(buf) >= 4:
                 # --- crossover / splice (with another corpus entry) ---
                 _seed_pool = [s for s in self.corpus if isinstance(s, Seed)]
                 if len(_seed_pool) > 1:
-                    other = random.choice(_seed_pool)
+                    other = _choice(_seed_pool)
                     if other.data and len(other.data) > 0:
                         other_buf = bytearray(other.data)
                         # 두 버퍼에서 랜덤 구간을 교차
-                        src_pos = random.randint(0, max(0, len(other_buf) - 1))
-                        copy_len = random.randint(1, min(len(other_buf) - src_pos, len(buf)))
-                        dst_pos = random.randint(0, max(0, len(buf) - copy_len))
+                        src_pos = _randint(0, max(0, len(other_buf) - 1))
+                        copy_len = _randint(1, min(len(other_buf) - src_pos, len(buf)))
+                        dst_pos = _randint(0, max(0, len(buf) - copy_len))
                         buf[dst_pos:dst_pos + copy_len] = other_buf[src_pos:src_pos + copy_len]
 
             elif mut == 13 and len(buf) >= 2:
                 # --- shuffle bytes in a random range ---
-                chunk_len = random.randint(2, min(16, len(buf)))
-                start = random.randint(0, len(buf) - chunk_len)
+                chunk_len = _randint(2, min(16, len(buf)))
+                start = _randrange(len(buf) - chunk_len + 1)
                 chunk = buf[start:start + chunk_len]
                 random.shuffle(chunk)
                 buf[start:start + chunk_len] = chunk
 
             elif mut == 14:
                 # --- set block to fixed value ---
-                block_len = random.randint(1, min(32, len(buf)))
-                start = random.randint(0, len(buf) - block_len)
-                val = random.choice([0x00, 0xFF, 0x41, 0x20, random.randint(0, 255)])
+                block_len = _randint(1, min(32, len(buf)))
+                start = _randrange(len(buf) - block_len + 1)
+                val = _choice([0x00, 0xFF, 0x41, 0x20, _randint(0, 255)])
                 buf[start:start + block_len] = bytes([val]) * block_len
 
             elif mut == 15 and len(buf) >= 8:
                 # --- ASCII integer insertion (AFL++ MOpt) ---
-                pos = random.randint(0, max(0, len(buf) - 8))
-                num = random.choice([
+                pos = _randint(0, max(0, len(buf) - 8))
+                num = _choice([
                     0, 1, -1, 0x7F, 0x80, 0xFF, 0x100, 0xFFFF, 0x10000,
-                    0x7FFFFFFF, 0xFFFFFFFF, random.randint(-1000000, 1000000)
+                    0x7FFFFFFF, 0xFFFFFFFF, _randint(-1000000, 1000000)
                 ])
                 num_str = str(num).encode('ascii')
                 end = min(pos + len(num_str), len(buf))
                 buf[pos:end] = num_str[:end - pos]
 
             # 무한 반복 방지: 너무 커지면 잘라냄
-            if len(buf) > self.config.max_input_len * 2:
-                buf = buf[:self.config.max_input_len]
+            if len(buf) > max_len * 2:
+                buf = buf[:max_len]
 
-        return bytes(buf[:self.config.max_input_len])
+        return bytes(buf[:max_len])
 
     # ── NSZE cache ───────────────────────────────────────────────────
     NSZE_CACHE_TTL = 5000
@@ -7124,7 +7390,8 @@ class NVMeFuzzer:
             r = subprocess.run(['nvme', 'attach-ns', ctrl,
                                 '-n', str(nsid), '-c', str(cntlid)],
                                capture_output=True, timeout=10)
-            subprocess.run(['nvme', 'ns-rescan', ctrl], capture_output=True, timeout=10)
+            subprocess.run(['nvme', 'ns-rescan', ctrl],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
             if r.returncode == 0:
                 log.warning(f"[NS-Reattach] nsid={nsid} → cntlid={cntlid} 재부착 성공 (Detach 복구)")
                 self.stats['ns_reattach_ok'] = self.stats.get('ns_reattach_ok', 0) + 1
@@ -7451,8 +7718,8 @@ class NVMeFuzzer:
             slba = random.choice([0, 1, max(0, nsze - 2), max(0, nsze - 1),
                                   nsze, nsze + 1, 0xFFFFFFFF, 0x100000000,
                                   random.randint(0, max(1, nsze))])
-            payload += struct.pack('<IIQ', ctx, lba_count & 0xFFFFFFFF,
-                                   slba & 0xFFFFFFFFFFFFFFFF)
+            payload += _DSM_RANGE_ENTRY.pack(ctx, lba_count & 0xFFFFFFFF,
+                                             slba & 0xFFFFFFFFFFFFFFFF)
         return payload
 
     def _make_copy_payload(self, entry_count: int, nsze: int) -> bytes:
@@ -7464,9 +7731,7 @@ class NVMeFuzzer:
                                   random.randint(0, max(1, nsze))])
             nlb = random.choice([0, 1, 0xFF, 0xFFFF, random.randint(0, 0xFFFF)])
             # SLBA(8) + NLB(2) + RSVD(2) + EILBRT(4) + ELBATM(2) + ELBAT(2) + RSVD(12) = 32B
-            payload += struct.pack('<QHHIHH',
-                                   slba & 0xFFFFFFFFFFFFFFFF, nlb, 0, 0, 0, 0)
-            payload += b'\x00' * 12
+            payload += _COPY_RANGE_ENTRY.pack(slba & 0xFFFFFFFFFFFFFFFF, nlb, 0, 0, 0, 0)
         return payload
 
     def _mutate_field_by_type(self, f: CDWField, nsze: int) -> int:
@@ -7516,34 +7781,33 @@ class NVMeFuzzer:
 
     def _mutate_cdw(self, value: int) -> int:
         """AFL++ 스타일 CDW (32-bit) 변형"""
+        # 2의 거듭제곱 범위([0, 2^k))는 randint(_randbelow + 인자 검사) 대신 getrandbits(k) 직접 — 분포 동일
         mut = random.randint(0, 5)
 
         if mut == 0:
             # bitflip 1~4 bits
-            for _ in range(random.randint(1, 4)):
-                value ^= (1 << random.randint(0, 31))
+            for _ in range(1 + random.getrandbits(2)):
+                value ^= (1 << random.getrandbits(5))
         elif mut == 1:
             # arith add/sub
             delta = random.randint(1, self.ARITH_MAX)
             value = (value + random.choice([-delta, delta])) & 0xFFFFFFFF
         elif mut == 2:
             # interesting 32-bit
-            value = random.choice(
-                self.INTERESTING_8 + self.INTERESTING_16 + self.INTERESTING_32
-            ) & 0xFFFFFFFF
+            value = random.choice(self._INT_32_POOL)
         elif mut == 3:
             # random 32-bit
-            value = random.randint(0, 0xFFFFFFFF)
+            value = random.getrandbits(32)
         elif mut == 4:
             # byte-level: 32비트 중 랜덤 바이트 1개만 변형
-            shift = random.choice([0, 8, 16, 24])
+            shift = random.getrandbits(2) << 3          # 0/8/16/24
             mask = 0xFF << shift
-            new_byte = random.randint(0, 255) << shift
+            new_byte = random.getrandbits(8) << shift
             value = (value & ~mask) | new_byte
         elif mut == 5:
             # endian swap (16-bit 또는 32-bit)
             if random.random() < 0.5:
-                value = struct.unpack('>I', struct.pack('<I', value & 0xFFFFFFFF))[0]
+                value = _U32_BE.unpack(_U32_LE.pack(value & 0xFFFFFFFF))[0]
             else:
                 # 16-bit halves swap
                 value = ((value >> 16) & 0xFFFF) | ((value & 0xFFFF) << 16)
@@ -7624,25 +7888,26 @@ class NVMeFuzzer:
 
         # [1] opcode mutation — 미정의/vendor-specific opcode로 dispatch 테이블 탐색
         if OPCODE_MUT_PROB > 0 and random.random() < OPCODE_MUT_PROB:
-            excluded = set(self.config.excluded_opcodes)
-            mut_type = random.randint(0, 3)
+            # opcode 범위는 모두 2의 거듭제곱 폭 → getrandbits 로 직접 (randint 와 분포 동일)
+            mut_type = random.getrandbits(2)
             if mut_type == 0:
                 # vendor-specific 범위 (0xC0~0xFF for admin, 0x80~0xFF for IO)
                 if seed.cmd.cmd_type == NVMeCommandType.ADMIN:
-                    new_seed.opcode_override = random.randint(0xC0, 0xFF)
+                    new_seed.opcode_override = 0xC0 | random.getrandbits(6)
                 else:
-                    new_seed.opcode_override = random.randint(0x80, 0xFF)
+                    new_seed.opcode_override = 0x80 | random.getrandbits(7)
             elif mut_type == 1:
                 # 완전 랜덤 opcode
-                new_seed.opcode_override = random.randint(0x00, 0xFF)
+                new_seed.opcode_override = random.getrandbits(8)
             elif mut_type == 2:
                 # 원본 opcode의 bit flip
-                new_seed.opcode_override = seed.cmd.opcode ^ (1 << random.randint(0, 7))
+                new_seed.opcode_override = seed.cmd.opcode ^ (1 << random.getrandbits(3))
             else:
                 # 다른 알려진 명령어의 opcode 가져오기
                 other_cmd = random.choice(NVME_COMMANDS)
                 new_seed.opcode_override = other_cmd.opcode
-            if new_seed.opcode_override is not None and new_seed.opcode_override in excluded:
+            if (new_seed.opcode_override is not None
+                    and (self._excluded_opcode_bits >> new_seed.opcode_override) & 1):
                 new_seed.opcode_override = None
 
         # [2] nsid mutation — 잘못된 namespace로 에러 핸들링 코드 탐색
@@ -7653,7 +7918,7 @@ class NVMeFuzzer:
                 0x00000002,       # 존재하지 않을 가능성 높은 NS
                 0xFFFFFFFE,       # boundary
                 random.randint(2, 0xFFFF),  # 랜덤 존재하지 않는 NS
-                random.randint(0, 0xFFFFFFFF),  # 완전 랜덤
+                random.getrandbits(32),     # 완전 랜덤
             ])
 
         # [3] Admin↔IO 교차 전송 — 잘못된 큐로 보내서 디스패치 혼란 유도
@@ -10027,6 +10292,87 @@ class NVMeFuzzer:
         return (f" status=0x{full:04x} SCT={sct}({self._SCT_NAMES.get(sct, '?')}) "
                 f"SC=0x{sc:02x}{flags} [{name}]")
 
+    # Admin 명령어별 고정 응답 크기
+    _ADMIN_FIXED_RESPONSE = {
+        "Identify": 4096,
+        "GetFeatures": 4096,
+        "TelemetryHostInitiated": 4096,
+        "DeviceSelfTest": 0,       # 데이터 전송 없음
+    }
+
+    # IO 명령어 중 NLB 기반 data_len 계산을 생략할 명령어
+    # (데이터 전송 자체가 없거나 별도 처리하는 명령어)
+    _IO_NO_NLB_DATA = frozenset(("Flush", "DatasetManagement",
+                                 "WriteZeroes", "WriteUncorrectable", "Verify"))
+
+    def _nvme_argv_parts(self, passthru_type: str) -> Tuple[str, Tuple[str, ...], str]:
+        """nvme-cli argv 의 명령마다 불변인 부분 (target_device, head, timeout 인자).
+        _io_device() 의 정규화/regex 와 f-string 포맷을 매 send 마다 반복하지 않도록 메모.
+        pre-flight 보정(nvme_device/namespace 변경)에도 맞도록 config 값을 키에 포함한다."""
+        key = (passthru_type, self.config.nvme_device, self.config.nvme_namespace,
+               self.config.nvme_passthru_timeout_ms)
+        parts = self._nvme_argv_cache.get(key)
+        if parts is None:
+            # io-passthru를 char device(/dev/nvme0)에 보내면
+            # "using deprecated NVME_IOCTL_IO_CMD ioctl on the char device!" 경고 발생.
+            # IO 명령은 namespace block device(/dev/nvme0n1)를 사용해야 한다.
+            # Admin 명령은 char device 그대로 사용.
+            if passthru_type == "io-passthru":
+                target_device = self._io_device()
+            else:
+                target_device = self.config.nvme_device
+            parts = (target_device,
+                     ('nvme', passthru_type, target_device),
+                     f'--timeout={self.config.nvme_passthru_timeout_ms}')
+            self._nvme_argv_cache[key] = parts
+        return parts
+
+    def _nvme_timeout_ms_table(self) -> dict:
+        """timeout_group → crash 판정 timeout(ms, PS entry/exit 마진 포함). 최초 1회 생성.
+        미정의 그룹은 'command' 값으로 채워 두어 send 시 dict 조회 1회로 끝나게 한다."""
+        table = self._timeout_ms_by_group
+        if table is None:
+            timeouts = self.config.nvme_timeouts
+            default_ms = timeouts.get('command', 8000)
+            groups = ({c.timeout_group for c in NVME_COMMANDS}
+                      | {'command', 'selftest_short', 'selftest_ext'} | set(timeouts))
+            table = {g: timeouts.get(g, default_ms) + PS_ENTRY_EXIT_MARGIN_MS for g in groups}
+            self._timeout_ms_by_group = table
+        return table
+
+    def _open_nvme_input_fd(self) -> None:
+        """Write 계열 입력 데이터 fd 준비 (최초 1회).
+        memfd 가 되면 그것을 쓴다 — 파일시스템 경로가 없는 익명 메모리 파일이라 tmpfs
+        dentry/inode 도 거치지 않는다. nvme-cli 에는 Popen(pass_fds) 으로 같은 번호의 fd 를
+        물려주고 '--input-file=/proc/self/fd/N' 으로 가리킨다(자식 기준 self = nvme-cli).
+        memfd_create 미지원(구 커널/비 Linux)이면 _pick_nvme_input_path() 파일로 fallback."""
+        if hasattr(os, 'memfd_create'):
+            try:
+                fd = os.memfd_create('nvme_fuzz_input', os.MFD_CLOEXEC)
+            except OSError:
+                pass
+            else:
+                self._nvme_input_fd = fd
+                self._nvme_input_pass_fds = (fd,)
+                self._nvme_input_path = f'/proc/self/fd/{fd}'
+                return
+        self._nvme_input_path = self._pick_nvme_input_path()
+        self._nvme_input_fd = os.open(
+            self._nvme_input_path,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o600)
+        self._nvme_input_pass_fds = ()
+
+    def _pick_nvme_input_path(self) -> str:
+        """Write 계열 입력 데이터 파일 경로 결정 (최초 1회).
+        /dev/shm(tmpfs)이 쓰기 가능하면 그쪽에 둔다 — 매 명령마다 덮어쓰는 파일이라
+        output_dir(디스크 FS)에 두면 write 마다 저널/메타데이터 갱신이 붙는다. nvme-cli 는
+        이 파일을 다시 메모리로 읽을 뿐이므로 영속성이 필요 없다. PID 를 붙여 동시 실행
+        인스턴스끼리 충돌하지 않게 하고, tmpfs 가 없으면 기존 output_dir 경로로 fallback."""
+        _shm = '/dev/shm'
+        if os.path.isdir(_shm) and os.access(_shm, os.W_OK):
+            return os.path.join(_shm, f'nvme_fuzz_input_{os.getpid()}.bin')
+        return str(self.output_dir / '.nvme_input.bin')
+
     def _send_nvme_command(self, data: bytes, seed: Seed,
                            record_history: bool = True) -> int:
         """subprocess(nvme-cli) 기반 NVMe passthru 명령 전송.
@@ -10054,7 +10400,7 @@ class NVMeFuzzer:
         if seed.force_admin is not None:
             passthru_type = "admin-passthru" if seed.force_admin else "io-passthru"
         else:
-            passthru_type = "admin-passthru" if cmd.cmd_type == NVMeCommandType.ADMIN else "io-passthru"
+            passthru_type = cmd.passthru_type
 
         # 가성 불량 방지 가드: host(kernel) 소유 전송로를 깨는 admin opcode 는 전송하지 않는다.
         # (Delete/Create I/O SQ·CQ, AER, Doorbell Buffer Config — admin 일 때만. IO 동명령은 정상)
@@ -10113,18 +10459,8 @@ class NVMeFuzzer:
             self.stats['blocked_format_ses'] = self.stats.get('blocked_format_ses', 0) + 1
             return self.RC_SKIP
 
-        # Admin 명령어별 고정 응답 크기
-        ADMIN_FIXED_RESPONSE = {
-            "Identify": 4096,
-            "GetFeatures": 4096,
-            "TelemetryHostInitiated": 4096,
-            "DeviceSelfTest": 0,       # 데이터 전송 없음
-        }
-
-        # IO 명령어 중 NLB 기반 data_len 계산을 생략할 명령어
-        # (데이터 전송 자체가 없거나 별도 처리하는 명령어)
-        IO_NO_NLB_DATA = ("Flush", "DatasetManagement",
-                          "WriteZeroes", "WriteUncorrectable", "Verify")
+        ADMIN_FIXED_RESPONSE = self._ADMIN_FIXED_RESPONSE
+        IO_NO_NLB_DATA = self._IO_NO_NLB_DATA
 
         # --- data_len 결정 ---
         data_len = 0
@@ -10159,25 +10495,30 @@ class NVMeFuzzer:
         # --- 입력 데이터 파일 준비 (Write 계열) ---
         input_file = None
         if write_data and data_len > 0:
-            if self._nvme_input_path is None:
-                self._nvme_input_path = str(self.output_dir / '.nvme_input.bin')
-            with open(self._nvme_input_path, 'wb') as f:
-                if seed.data_len_override is not None:
-                    f.write(data[:data_len].ljust(data_len, b'\x00'))
-                else:
-                    # LBA 크기와 data 길이가 불일치하면 data_len에 맞게 조정
-                    # (예: Write 시드가 512B 고정인데 LBA=4096인 경우 패딩)
-                    f.write(data[:data_len].ljust(data_len, b'\x00'))
+            # fd 는 최초 1회만 열고 유지 — 매 명령 open/close(pathwalk + struct file 할당)
+            # 대신 pwrite(offset 0) + ftruncate 로 내용만 교체한다. 닫기는 run() finally.
+            if self._nvme_input_fd is None:
+                self._open_nvme_input_fd()
+            # LBA 크기와 data 길이가 불일치하면 data_len에 맞게 조정
+            # (예: Write 시드가 512B 고정인데 LBA=4096인 경우 패딩)
+            os.pwrite(self._nvme_input_fd, data[:data_len].ljust(data_len, b'\x00'), 0)
+            # 크기는 달라졌을 때만 맞춘다 — 같은 명령은 대개 같은 data_len(512/4096)이라
+            # 대부분의 iteration 은 pwrite 1회로 끝난다.
+            if data_len != self._nvme_input_size:
+                os.ftruncate(self._nvme_input_fd, data_len)
+                self._nvme_input_size = data_len
             input_file = self._nvme_input_path
 
         # --- 타임아웃 --- (퍼저가 "crash"로 판단하는 창)
         # mutation 으로 실제 전송 opcode/타입이 바뀌면 원본 timeout_group 무효 →
         # 실제 (opcode, 타입) 명령으로 재해석. 미지 opcode 는 'command' 기본값.
         actual_type_val = "admin" if passthru_type == "admin-passthru" else "io"
-        if (actual_opcode, actual_type_val) == (cmd.opcode, cmd.cmd_type.value):
+        if actual_opcode == cmd.opcode and actual_type_val == cmd.type_val:
             eff_cmd = cmd
+        elif 0 <= actual_opcode <= 0xFF:
+            eff_cmd = _OPCODE_CMD_TABLE[actual_type_val][actual_opcode]
         else:
-            eff_cmd = _OPCODE_TO_CMD.get((actual_opcode, actual_type_val))
+            eff_cmd = None
         effective_tg = eff_cmd.timeout_group if eff_cmd is not None else "command"
         # DeviceSelfTest: CDW10[3:0] STC 값으로 Short(0x1)/Extended(0x2) 구분
         if eff_cmd is not None and eff_cmd.name == "DeviceSelfTest":
@@ -10186,30 +10527,20 @@ class NVMeFuzzer:
                 effective_tg = "selftest_ext"
             else:
                 effective_tg = "selftest_short"  # 0x1 또는 기타 → short 기본값
-        timeout_ms = self.config.nvme_timeouts.get(
-            effective_tg,
-            self.config.nvme_timeouts.get('command', 8000)
-        )
-        # PS entry/exit latency 마진: 어떤 PS 상태에서든 복귀 지연을 흡수
-        timeout_ms += PS_ENTRY_EXIT_MARGIN_MS
+        # PS entry/exit latency 마진(어떤 PS 상태에서든 복귀 지연 흡수)은 테이블 값에 포함
+        timeout_ms = self._nvme_timeout_ms_table()[effective_tg]
+
+        # --- nvme CLI 명령 구성 ---
+        # 불변 부분(nvme/passthru 타입/device, --timeout)은 _nvme_argv_parts 메모에서.
         # nvme-cli --timeout: 커널이 NVMe 명령을 포기하는 시점 (v4.6: 분리)
         # 이 값을 길게 유지하면 crash 시 커널이 controller reset을 하지 않아
         # SSD 펌웨어 상태를 그대로 보존할 수 있다 (JTAG 분석 용이).
-        passthru_timeout_ms = self.config.nvme_passthru_timeout_ms
-
-        # --- nvme CLI 명령 구성 ---
-        # io-passthru를 char device(/dev/nvme0)에 보내면
-        # "using deprecated NVME_IOCTL_IO_CMD ioctl on the char device!" 경고 발생.
-        # IO 명령은 namespace block device(/dev/nvme0n1)를 사용해야 한다.
-        # Admin 명령은 char device 그대로 사용.
-        if passthru_type == "io-passthru":
-            target_device = self._io_device()
-        else:
-            target_device = self.config.nvme_device
+        target_device, _argv_head, _argv_tail = self._nvme_argv_parts(passthru_type)
 
         nvme_cmd = [
-            'nvme', passthru_type, target_device,
-            f'--opcode={actual_opcode:#x}',
+            *_argv_head,
+            (_OPCODE_ARGV[actual_opcode] if 0 <= actual_opcode <= 0xFF
+             else f'--opcode={actual_opcode:#x}'),
             f'--namespace-id={actual_nsid}',
             f'--cdw2={seed.cdw2:#x}',
             f'--cdw3={seed.cdw3:#x}',
@@ -10219,7 +10550,7 @@ class NVMeFuzzer:
             f'--cdw13={seed.cdw13:#x}',
             f'--cdw14={seed.cdw14:#x}',
             f'--cdw15={seed.cdw15:#x}',
-            f'--timeout={passthru_timeout_ms}',
+            _argv_tail,
         ]
 
         if data_len > 0:
@@ -10266,7 +10597,8 @@ class NVMeFuzzer:
                  f"cdw12=0x{seed.cdw12:08x} data_len={data_len}"
                  f" data={data[:16].hex() if data else 'N/A'}"
                  f"{'...' if data and len(data) > 16 else ''}"
-                 f"{mut_str}")
+                 f"{mut_str}",
+                 extra={'flush_now': True})   # 명령이 hang/timeout 돼도 이 줄은 디스크에 남게
 
         # "덫 놓기" 전략: subprocess 전에 샘플링 시작
         # NOTE: stop_sampling()은 메인 루프(run)에서 호출 — 여기서는 하지 않음
@@ -10279,6 +10611,7 @@ class NVMeFuzzer:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 start_new_session=True,  # v4.6: setsid() — 부모 종료/SIGHUP 후에도 생존
+                pass_fds=self._nvme_input_pass_fds if input_file else (),
             )
 
             # 타임아웃 시 공통 처리: kill → fd 닫힘 → 커널 abort → controller reset →
@@ -10343,6 +10676,7 @@ class NVMeFuzzer:
                          + ("  (halt 오버헤드 지배 — 초고속 명령)" if _freeze > _wall else ""))
 
             rc = process.returncode
+            _done_ns = time.monotonic_ns()   # 명령 완료 시점 — post_cmd_delay 기준점
 
             # FWCommit(0x10) 성공 = 펌웨어 활성화로 R5 코어가 리셋될 수 있고, 그러면 프로브(USB)는
             # 살아있어도 타겟 디버그가 끊겨 halt 가 죽는다. 즉시 재연결하면 아직 샘플링 스레드가
@@ -10360,9 +10694,12 @@ class NVMeFuzzer:
                              "재연결 예약(다음 회계 시점)")
 
             # SSD 내부에서 명령 완료 후에도 후처리(캐시 플러시, 로그 기록 등)가
-            # 진행될 수 있으므로, 해당 시간만큼 샘플링을 계속 유지
+            # 진행될 수 있으므로, 해당 시간만큼 샘플링을 계속 유지.
+            # 기준은 완료 시점 — 그 사이 처리(FWCommit 캐시 무효화·로그)에 쓴 시간은 빼고 남은 만큼만 잔다.
             if self.config.post_cmd_delay_ms > 0:
-                time.sleep(self.config.post_cmd_delay_ms / 1000.0)
+                _rem_ns = self.config.post_cmd_delay_ms * 1_000_000 - (time.monotonic_ns() - _done_ns)
+                if _rem_ns > 0:
+                    time.sleep(_rem_ns / 1_000_000_000)
 
             # rc(exit code)는 SC 하위 8비트만 → 추가 정보 출력.
             #  · NVMe 완료 에러: stderr/stdout 의 'NVMe status: NAME(0xVAL)' → full status(SCT 포함).
@@ -10630,7 +10967,7 @@ class NVMeFuzzer:
             # 여기서만 pkill — rc!=0 정상 종료 경로는 JLinkExe가 이미 종료된 상태.
             try:
                 subprocess.run(['pkill', '-9', '-x', JLINK_BINARY],
-                               capture_output=True, timeout=5)
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
             except Exception:
                 pass
             return
@@ -11342,8 +11679,7 @@ class NVMeFuzzer:
             if seed.force_admin is not None:
                 passthru_type = 'admin-passthru' if seed.force_admin else 'io-passthru'
             else:
-                passthru_type = ('admin-passthru' if cmd.cmd_type == NVMeCommandType.ADMIN
-                                 else 'io-passthru')
+                passthru_type = cmd.passthru_type
             device = (self.config.nvme_device if passthru_type == 'admin-passthru'
                       else self._io_device())
             data = seed.data
@@ -11828,7 +12164,7 @@ class NVMeFuzzer:
           안에 replay 만 남고 json 은 루트에 흩어져 있었다.
         """
         # crash 식별자는 data 만이 아니라 명령 파라미터(cdw/override) 전체로 해시한다.
-        # data 가 빈 명령(DeviceSelfTest 등)은 md5(b'') 가 상수라, cdw10 만 다른 별개
+        # data 가 빈 명령(DeviceSelfTest 등)은 해시(b'') 가 상수라, cdw10 만 다른 별개
         # 크래시가 같은 파일명으로 서로 덮어쓰던 문제 방지. opcode 도 변형 후 실제값 사용.
         _actual_opcode = (seed.opcode_override if seed.opcode_override is not None
                           else seed.cmd.opcode)
@@ -11836,7 +12172,8 @@ class NVMeFuzzer:
                   seed.cdw12, seed.cdw13, seed.cdw14, seed.cdw15,
                   seed.opcode_override, seed.nsid_override,
                   seed.force_admin, seed.data_len_override)
-        input_hash = hashlib.md5(repr(_ident).encode()).hexdigest()[:12]
+        # 파일명 지문 — corpus 파일명과 같은 blake2b 6B digest(=12 hex).
+        input_hash = hashlib.blake2b(repr(_ident).encode(), digest_size=6).hexdigest()
         filename = f"crash_{seed.cmd.name}_{hex(_actual_opcode)}_{input_hash}"
         filepath = (dest_dir or self.crashes_dir) / filename
 
@@ -11845,7 +12182,6 @@ class NVMeFuzzer:
         meta["timestamp"] = datetime.now().isoformat()
 
         if stuck_pcs:
-            from collections import Counter
             n_cores = len(stuck_pcs[0]) if stuck_pcs else 0
             meta["stuck_pcs_count"] = len(stuck_pcs)
             # 샘플별 코어 PC 목록: [[core0, core1, ...], ...]
@@ -11873,8 +12209,6 @@ class NVMeFuzzer:
         stuck PC 분석 → dmesg 캡처 → crash 저장 → _timeout_crash 플래그 설정.
         호출 후 caller는 break로 현재 루프를 탈출해야 한다.
         """
-        from collections import Counter
-
         # stderr 복원 최우선 (calibration 구간 /dev/null 리다이렉트 해제 → 로그가 터미널에 보이게).
         if self._cal_saved_stderr_fd is not None:
             os.dup2(self._cal_saved_stderr_fd, 2)
@@ -12067,7 +12401,7 @@ class NVMeFuzzer:
 
         # 3.5) 재현 TC replay 스크립트 생성 — crash_<ts>/ 안에 직접 생성하여
         # replay_<tag>.sh + replay_data_<tag>/ 가 함께 self-contained.
-        _replay_tag = hashlib.md5(fuzz_data).hexdigest()[:8]
+        _replay_tag = hashlib.blake2b(fuzz_data, digest_size=4).hexdigest()
         log.warning(f"[TIMEOUT] 재현 TC 스크립트를 생성합니다 → {_logname(_crash_dir)}/")
         try:
             self._generate_replay_sh(_crash_dir, _replay_tag)
@@ -12221,6 +12555,8 @@ class NVMeFuzzer:
         graph_dir = self.output_dir / 'graphs'
         graph_dir.mkdir(parents=True, exist_ok=True)
 
+        # 명령별 edge 집합 — 아래 summary.json 에서도 재사용 (trace 재순회 방지)
+        edges_by_cmd: Dict[str, Set[Tuple[int, int]]] = {}
         for cmd_name in self.cmd_pcs:
             pcs = self.cmd_pcs[cmd_name]
             traces = self.cmd_traces[cmd_name]
@@ -12228,11 +12564,11 @@ class NVMeFuzzer:
             if not pcs:
                 continue
 
-            # edges를 traces에서 도출
+            # edges를 traces에서 도출 — 인접 쌍을 zip(trace, trace[1:]) 슬라이스로 (인덱스 루프 제거)
             edges: Set[Tuple[int, int]] = set()
             for trace in traces:
-                for i in range(len(trace) - 1):
-                    edges.add((trace[i], trace[i + 1]))
+                edges.update(zip(trace, trace[1:]))
+            edges_by_cmd[cmd_name] = edges
 
             data = {
                 "command": cmd_name,
@@ -12252,16 +12588,11 @@ class NVMeFuzzer:
 
         # 전체 통합 데이터도 저장
         all_data = {}
-        for cmd_name in self.cmd_pcs:
-            if self.cmd_pcs[cmd_name]:
-                edges_from_traces: Set[Tuple[int, int]] = set()
-                for trace in self.cmd_traces[cmd_name]:
-                    for i in range(len(trace) - 1):
-                        edges_from_traces.add((trace[i], trace[i + 1]))
-                all_data[cmd_name] = {
-                    "pcs": len(self.cmd_pcs[cmd_name]),
-                    "edges": len(edges_from_traces),
-                }
+        for cmd_name, edges in edges_by_cmd.items():
+            all_data[cmd_name] = {
+                "pcs": len(self.cmd_pcs[cmd_name]),
+                "edges": len(edges),
+            }
         with open(graph_dir / 'summary.json', 'w') as f:
             json.dump(all_data, f, indent=2)
 
@@ -13309,7 +13640,7 @@ class NVMeFuzzer:
                  f"({len(self._csfuzz_history)} updates)")
 
     def _collect_stats(self) -> dict:
-        elapsed = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+        elapsed = self._elapsed_s()
         return {
             'version': self.VERSION,
             'executions': self.executions,
@@ -13323,7 +13654,7 @@ class NVMeFuzzer:
             'command_stats': self.cmd_stats,
             'rc_stats': {k: dict(v) for k, v in self.rc_stats.items()},
             'mutation_stats': dict(self.mutation_stats),
-            'actual_opcode_dist': dict(self.actual_opcode_dist),
+            'actual_opcode_dist': {op: n for op, n in enumerate(self.actual_opcode_dist) if n},
             'passthru_stats': dict(self.passthru_stats),
         }
 
@@ -14289,7 +14620,11 @@ class NVMeFuzzer:
             log.info("[Calibration] Disabled (calibration_runs=0)")
 
         self.start_time = datetime.now()
-        self._window_t0 = self.start_time          # 구간별 exec/s 계산용
+        self._start_ns = time.monotonic_ns()
+        # 런타임 상한은 monotonic 정수 deadline 으로 1회 환산 — 매 iteration 의
+        # datetime.now() 객체 생성 + timedelta 산술 대신 int 비교 1회 (NTP 보정에도 무관).
+        _deadline_ns = self._start_ns + int(self.config.total_runtime_sec * 1_000_000_000)
+        self._window_t0 = self._start_ns           # 구간별 exec/s 계산용 (monotonic_ns)
         self._window_exec0: int = 0
         # calibration 실행 횟수를 제외하고 main loop 기준으로 카운트 재시작
         self.executions = 0
@@ -14309,8 +14644,7 @@ class NVMeFuzzer:
                 if self._timeout_crash:
                     break
 
-                elapsed = (datetime.now() - self.start_time).total_seconds()
-                if elapsed >= self.config.total_runtime_sec:
+                if time.monotonic_ns() >= _deadline_ns:
                     log.info("Runtime limit reached")
                     break
 
@@ -14377,7 +14711,7 @@ class NVMeFuzzer:
                             self.sampler.stop_sampling()
                             _pm_new_set = self.sampler.current_trace - self.sampler.global_coverage
                             _pm_new_cnt = len(_pm_new_set)
-                            self.sampler.global_coverage.update(self.sampler.current_trace)
+                            self.sampler.global_coverage |= _pm_new_set
                             if _pm_new_cnt > 0:
                                 if self._sa_loaded:
                                     self._update_static_coverage(self.sampler.current_trace)
@@ -14400,7 +14734,7 @@ class NVMeFuzzer:
                         self.sampler.stop_sampling()
                         _pm_new_set = self.sampler.current_trace - self.sampler.global_coverage
                         _pm_new_cnt = len(_pm_new_set)
-                        self.sampler.global_coverage.update(self.sampler.current_trace)
+                        self.sampler.global_coverage |= _pm_new_set
                         if _pm_new_cnt > 0:
                             if self._sa_loaded:
                                 self._update_static_coverage(self.sampler.current_trace)
@@ -14413,7 +14747,7 @@ class NVMeFuzzer:
                         self.sampler.stop_sampling()
                         _pm_new_set = self.sampler.current_trace - self.sampler.global_coverage
                         _pm_new_cnt = len(_pm_new_set)
-                        self.sampler.global_coverage.update(self.sampler.current_trace)
+                        self.sampler.global_coverage |= _pm_new_set
                         if _pm_new_cnt > 0:
                             if self._sa_loaded:
                                 self._update_static_coverage(self.sampler.current_trace)
@@ -14435,7 +14769,7 @@ class NVMeFuzzer:
                         self.sampler.stop_sampling()
                         _pm_new_set = self.sampler.current_trace - self.sampler.global_coverage
                         _pm_new_cnt = len(_pm_new_set)
-                        self.sampler.global_coverage.update(self.sampler.current_trace)
+                        self.sampler.global_coverage |= _pm_new_set
                         if _pm_new_cnt > 0:
                             if self._sa_loaded:
                                 self._update_static_coverage(self.sampler.current_trace)
@@ -15009,6 +15343,20 @@ class NVMeFuzzer:
             except Exception as e:
                 log.error(f"CSFuzz dynamics graph generation failed: {e}")
 
+            # 입력 파일 fd 닫기 + tmpfs 파일 정리
+            # (nvme-cli 는 실행 시점에 이미 읽었으므로 crash 보존과 무관)
+            if self._nvme_input_fd is not None:
+                try:
+                    os.close(self._nvme_input_fd)
+                except OSError:
+                    pass
+                self._nvme_input_fd = None
+            if self._nvme_input_path and self._nvme_input_path.startswith('/dev/shm/'):
+                try:
+                    os.unlink(self._nvme_input_path)
+                except OSError:
+                    pass
+
             try:
                 for h in log.handlers:
                     h.flush()
@@ -15214,7 +15562,7 @@ if __name__ == "__main__":
 
     # 커버리지 resume
     parser.add_argument('--resume-coverage', default=RESUME_COVERAGE,
-                        help='Path to previous coverage.txt')
+                        help='Path to previous coverage.txt (or coverage.bin — 빠른 로드)')
 
     # FW Download/Commit
     parser.add_argument('--fw-bin', default=_FW_BIN_PATH,
@@ -15323,7 +15671,8 @@ if __name__ == "__main__":
 
     # 활성화될 명령어 결정
     if args.commands:
-        active_cmds = [c for c in NVME_COMMANDS if c.name in args.commands]
+        _wanted = set(args.commands)
+        active_cmds = [c for c in NVME_COMMANDS if c.name in _wanted]
     elif args.all_commands:
         active_cmds = NVME_COMMANDS
     else: